@@ -17,12 +17,28 @@ import sys
 from typing import Any, Dict, List, Optional
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, stdlib json is the fallback
+    orjson = None
+
 BASE = (os.environ.get("WGER_BASE_URL") or "https://wger.de/api/v2").strip().rstrip("/")
 
 OUT_DIR = "integrations/wger/catalog"
 EX_JSON = os.path.join(OUT_DIR, "exercises_en.json")
 EX_CSV  = os.path.join(OUT_DIR, "exercises_en.csv")
 
+def write_json(path: str, data: Any) -> None:
+    """Write UTF-8, 2-space-indented JSON atomically (tmp file + rename)."""
+    if orjson:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
 def fetch_all(url: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
     next_url = url
@@ -81,8 +97,7 @@ def refresh_exercises() -> int:
             "description_html": eng["description"],
         })
 
-    with open(EX_JSON, "w", encoding="utf-8") as jf:
-        json.dump(tidy, jf, ensure_ascii=False, indent=2)
+    write_json(EX_JSON, tidy)
 
     fieldnames = [
         "id","uuid","name","category",
@@ -93,8 +108,7 @@ def refresh_exercises() -> int:
 def refresh_simple(endpoint: str, out_file: str) -> int:
     os.makedirs(OUT_DIR, exist_ok=True)
     rows = fetch_all(f"{BASE}/{endpoint}/", params={"limit": 200})
-    with open(os.path.join(OUT_DIR, out_file), "w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
+    write_json(os.path.join(OUT_DIR, out_file), rows)
     print(f"[wger] Wrote {len(rows)} rows → {out_file}")
     return len(rows)
 
@@ -6,24 +6,32 @@ It uses a centralized configuration service for credentials and API URLs.
 
 import requests
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 # Import the centralized settings object
 from pete_e.config import settings
+from pete_e.infra.http_utils import session_with_retries
 from pete_e.infra.log_utils import log_message
 
 
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """Keep-alive session shared by all clients, with the auth headers applied once."""
+    return session_with_retries(headers={
+        "Authorization": f"Token {settings.WGER_API_KEY}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    })
+
+
 class WgerClient:
     """A client to interact with the Wger API."""
 
     def __init__(self):
         """Initializes the client with credentials from the settings."""
         self.api_key = settings.WGER_API_KEY
-        self.base_url = settings.WGER_API_URL
-        self.headers = {
-            "Authorization": f"Token {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        self.base_url = settings.WGER_API_URL.rstrip("/")
+        self.session = _session()
 
     def fetch_logs(self, days: int = 1) -> list[dict]:
         """Fetch workout logs from Wger for the past N days."""
@@ -43,7 +51,7 @@ class WgerClient:
         }
 
         try:
-            r = requests.get(url, headers=self.headers, params=params, timeout=30)
+            r = self.session.get(url, params=params, timeout=30)
             r.raise_for_status()
             js = r.json()
             results = js.get("results", [])
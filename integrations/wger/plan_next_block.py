@@ -17,6 +17,11 @@ import datetime as dt
 import json
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, stdlib json is the fallback
+    orjson = None
+
 KNOWLEDGE_PATH = "knowledge/history.json"
 OUT_DIR = "integrations/wger/plans"
 STATE_DIR = "integrations/wger/state"
@@ -24,10 +29,22 @@ STATE_DIR = "integrations/wger/state"
 
 def load_knowledge() -> dict:
     """Load historical training knowledge, if available."""
-    if not os.path.exists(KNOWLEDGE_PATH):
+    try:
+        with open(KNOWLEDGE_PATH, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         return {}
-    with open(KNOWLEDGE_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def dump_json(path: str, data: dict) -> None:
+    """Write 2-space-indented JSON, encoded straight to bytes with orjson when available."""
+    if orjson:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(raw)
 
 
 def build_block(start_date: dt.date) -> dict:
@@ -81,7 +98,6 @@ if __name__ == "__main__":
     os.makedirs(OUT_DIR, exist_ok=True)
     out_path = os.path.join(OUT_DIR, f"plan_{start_date.isoformat()}.json")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(block, f, indent=2)
+    dump_json(out_path, block)
 
     print(f"[build_block] Wrote {out_path}")
@@ -21,12 +21,21 @@ import argparse
 import datetime as dt
 import difflib
 import json
+import logging
 import os
 import re
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional, stdlib json is the fallback
+    orjson = None
 
 # ---------- Environment & HTTP ----------
 
@@ -36,32 +45,56 @@ API_KEY = (os.environ.get("WGER_API_KEY") or "").strip()
 HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
+    "Connection": "keep-alive",
 }
 if API_KEY:
     HEADERS["Authorization"] = f"Token {API_KEY}"
 
-def log(msg: str) -> None:
-    print(msg, flush=True)
+def session_with_retries() -> requests.Session:
+    """One pooled keep-alive session so every call reuses the TLS connection to wger."""
+    # Status retries are for GET only. A 5xx from a proxy can arrive after wger
+    # has already created the routine/day/slot, so re-sending a POST or PATCH
+    # could create a duplicate. Connection failures (nothing sent) are still
+    # retried for every method.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.6,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    s.headers.update(HEADERS)
+    return s
+
+SESSION = session_with_retries()
+
+logger = logging.getLogger("wger.routine_builder")
+
+# Days upload on worker threads; each thread records the day it is building
+# so every line it logs (slot, entry, config, errors) names that day.
+_log_context = threading.local()
+
+def log(msg: str, *args: Any) -> None:
+    # %-style args are only formatted if a handler actually emits the record.
+    day = getattr(_log_context, "day", None)
+    if day is not None:
+        msg, args = "[day %s] " + msg, (day, *args)
+    logger.info(msg, *args)
 
 def _truncate(s: str, n: int = 800) -> str:
     return s if len(s) <= n else s[:n] + "…"
 
 def _req(method: str, url: str, json_payload: Optional[Dict[str, Any]] = None,
-         ok=(200, 201), tries=2, backoff=0.6) -> requests.Response:
-    last = None
-    for i in range(tries):
-        r = requests.request(method, url, headers=HEADERS, json=json_payload, timeout=60)
-        if r.status_code in ok:
-            return r
-        log(f"Error:  {method} {url} -> {r.status_code}: {_truncate(r.text)}")
-        last = r
-        if 500 <= r.status_code < 600 and i < tries - 1:
-            time.sleep(backoff)
-            continue
-        r.raise_for_status()
-    assert last is not None
-    last.raise_for_status()
-    return last
+         ok=(200, 201)) -> requests.Response:
+    # Retries live in the session's adapter only; a second loop here would
+    # multiply attempts and re-send non-idempotent creates.
+    r = SESSION.request(method, url, json=json_payload, timeout=60)
+    if r.status_code not in ok:
+        log("Error:  %s %s -> %s: %s", method, url, r.status_code, _truncate(r.text))
+    r.raise_for_status()
+    return r
 
 def GET(path_or_url: str) -> Dict[str, Any]:
     url = path_or_url if path_or_url.startswith("http") else f"{BASE}{path_or_url}"
@@ -74,6 +107,7 @@ def POST(path: str, payload: Dict[str, Any], ok=(201,)) -> Dict[str, Any]:
 
 MAX_ROUTINE_NAME = 25
 MAX_DAY_NAME = 20  # public server constraint
+MAX_WORKERS = 8    # concurrent day uploads; keep <= the session pool size
 
 def routine_name_from_dates(start: str, end: str) -> str:
     s = dt.date.fromisoformat(start)
@@ -103,8 +137,10 @@ def parse_reps(v: Any) -> Optional[Tuple[int, Optional[int]]]:
             return (mn, mx)
     return None
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
 def normalize(s: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (s or "").lower())
+    return _NON_ALNUM.sub("", (s or "").lower())
 
 ALIASES = {
     "barbellbentoverrow": ["bentoverbarbellrow","bentoverrowbarbell","barbellrow"],
@@ -114,7 +150,28 @@ ALIASES = {
 
 # ---------- Exercise index from /exerciseinfo/ (English) ----------
 
-def build_exercise_index(language_id: int = 2) -> Tuple[Dict[str, List[int]], Dict[int, str]]:
+# English catalog kept fresh by catalog_refresh.py (weekly workflow).
+CATALOG_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog", "exercises_en.json")
+
+def index_from_catalog(path: str) -> Tuple[Dict[str, List[int]], Dict[int, str]]:
+    """Same index as build_exercise_index, from the committed catalog file."""
+    name_index: Dict[str, List[int]] = {}
+    id_to_name: Dict[int, str] = {}
+    for row in _read_json(path):
+        name = row.get("name")
+        if not name or row.get("id") is None:
+            continue
+        ex_id = int(row["id"])
+        id_to_name[ex_id] = name
+        name_index.setdefault(normalize(name), []).append(ex_id)
+    log("[index] Loaded %d exercises from %s", len(id_to_name), path)
+    return name_index, id_to_name
+
+def build_exercise_index(language_id: int = 2, use_catalog: bool = True) -> Tuple[Dict[str, List[int]], Dict[int, str]]:
+    # The catalog is English-only; skip the multi-page crawl when it applies.
+    if use_catalog and language_id == 2 and os.path.exists(CATALOG_JSON):
+        return index_from_catalog(CATALOG_JSON)
+
     log("[index] Loading exercises from /exerciseinfo/ …")
     name_index: Dict[str, List[int]] = {}
     id_to_name: Dict[int, str] = {}
@@ -135,7 +192,7 @@ def build_exercise_index(language_id: int = 2) -> Tuple[Dict[str, List[int]], Di
             id_to_name[ex_id] = en_name
             name_index.setdefault(key, []).append(ex_id)
         url = page.get("next") or ""
-    log(f"[index] Loaded {len(id_to_name)} exercises")
+    log("[index] Loaded %d exercises", len(id_to_name))
     return name_index, id_to_name
 
 def resolve_exercise_id(name_index: Dict[str, List[int]], name: str) -> Optional[int]:
@@ -145,18 +202,46 @@ def resolve_exercise_id(name_index: Dict[str, List[int]], name: str) -> Optional
     for alt in ALIASES.get(key, []):
         if alt in name_index:
             return name_index[alt][0]
-    match = difflib.get_close_matches(key, list(name_index.keys()), n=1, cutoff=0.74)
+    # Keys are already normalised; difflib can walk the dict directly.
+    match = difflib.get_close_matches(key, name_index, n=1, cutoff=0.74)
     return name_index[match[0]][0] if match else None
 
 # ---------- Plan loader ----------
 
+def _read_json(path: str) -> Any:
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _date_span(days_src: List[Dict[str, Any]]) -> Tuple[str, str]:
+    ds = [d["date"] for d in days_src if "date" in d]
+    return min(ds), max(ds)
+
+def _normalize_days(days_src: List[Dict[str, Any]], bare_slot: bool) -> List[Dict[str, Any]]:
+    """
+    One pass over the source days for every plan shape. `bare_slot` keeps an
+    empty slot for days without exercises (flat/list plans); routine plans
+    leave those days slot-less.
+    """
+    days_out: List[Dict[str, Any]] = []
+    for idx, d in enumerate(days_src, start=1):
+        slots = d.get("slots")
+        if not slots:
+            exercises = d.get("exercises")
+            slots = [{"order": 1, "exercises": exercises or []}] if exercises or bare_slot else []
+        days_out.append({
+            "name": (d.get("name") or f"Day {idx}")[:MAX_DAY_NAME],
+            "is_rest": bool(d.get("is_rest", False)),
+            "slots": slots,
+        })
+    return days_out
+
 def load_plan(path: str) -> Tuple[str, str, List[Dict[str, Any]]]:
     """
     Returns (start, end, days)
     Days: [{"name": str, "is_rest": bool, "slots":[{"order": int, "exercises":[{...}]}]}]
     """
-    with open(path, "r", encoding="utf-8") as f:
-        doc = json.load(f)
+    doc = _read_json(path)
 
     # {"routine": {...}, "days":[...]}
     if isinstance(doc, dict) and "routine" in doc and "days" in doc:
@@ -165,19 +250,7 @@ def load_plan(path: str) -> Tuple[str, str, List[Dict[str, Any]]]:
         end   = r.get("end")   or r.get("end_date")
         if not start or not end:
             raise ValueError("Plan.routine.start and Plan.routine.end are required.")
-        days_src = doc.get("days") or []
-        days_out: List[Dict[str, Any]] = []
-        for idx, d in enumerate(days_src, start=1):
-            name = (d.get("name") or f"Day {idx}")[:MAX_DAY_NAME]
-            is_rest = bool(d.get("is_rest", False))
-            if d.get("slots"):
-                slots = d["slots"]
-            elif d.get("exercises"):
-                slots = [{"order": 1, "exercises": d["exercises"]}]
-            else:
-                slots = []
-            days_out.append({"name": name, "is_rest": is_rest, "slots": slots})
-        return start, end, days_out
+        return start, end, _normalize_days(doc.get("days") or [], bare_slot=False)
 
     # {"start","end","days":[...]} or infer from per-day "date"
     if isinstance(doc, dict) and "days" in doc:
@@ -186,33 +259,18 @@ def load_plan(path: str) -> Tuple[str, str, List[Dict[str, Any]]]:
         end   = doc.get("end")   or doc.get("end_date")
         if not start or not end:
             try:
-                ds = [d["date"] for d in days_src if "date" in d]
-                start, end = min(ds), max(ds)
+                start, end = _date_span(days_src)
             except Exception:
                 raise ValueError("Plan missing start/end and days lack 'date' fields.")
-        days_out: List[Dict[str, Any]] = []
-        for idx, d in enumerate(days_src, start=1):
-            name = (d.get("name") or f"Day {idx}")[:MAX_DAY_NAME]
-            is_rest = bool(d.get("is_rest", False))
-            slots = d.get("slots") or [{"order": 1, "exercises": d.get("exercises", [])}]
-            days_out.append({"name": name, "is_rest": is_rest, "slots": slots})
-        return start, end, days_out
+        return start, end, _normalize_days(days_src, bare_slot=True)
 
     # list of days (must have per-day date or provide outer start/end)
     if isinstance(doc, list):
-        days_src = doc
         try:
-            ds = [d["date"] for d in days_src if "date" in d]
-            start, end = min(ds), max(ds)
+            start, end = _date_span(doc)
         except Exception:
             raise ValueError("List plan requires per-day 'date' OR provide an object with start/end.")
-        days_out: List[Dict[str, Any]] = []
-        for idx, d in enumerate(days_src, start=1):
-            name = (d.get("name") or f"Day {idx}")[:MAX_DAY_NAME]
-            is_rest = bool(d.get("is_rest", False))
-            slots = d.get("slots") or [{"order": 1, "exercises": d.get("exercises", [])}]
-            days_out.append({"name": name, "is_rest": is_rest, "slots": slots})
-        return start, end, days_out
+        return start, end, _normalize_days(doc, bare_slot=True)
 
     raise ValueError("Unrecognized plan format.")
 
@@ -236,7 +294,7 @@ def create_routine(start: str, end: str, description: str = "", fit_in_week: boo
     if description: payload["description"] = description[:1000]
     res = POST("/routine/", payload)
     rid = int(res["id"])
-    log(f"[OK] Created routine id={rid} name={payload['name']}")
+    log("[OK] Created routine id=%s name=%s", rid, payload["name"])
     return rid
 
 def create_day(routine_id: int, order: int, name: str, is_rest: bool, description: str = "") -> int:
@@ -244,56 +302,84 @@ def create_day(routine_id: int, order: int, name: str, is_rest: bool, descriptio
     if description: payload["description"] = description[:250]
     res = POST("/day/", payload)
     did = int(res["id"])
-    log(f"  [day] {order} {name[:MAX_DAY_NAME]} → id={did} rest={is_rest}")
+    log("  [day] %s %s → id=%s rest=%s", order, name[:MAX_DAY_NAME], did, is_rest)
     return did
 
 def create_slot(day_id: int, order: int) -> int:
     res = POST("/slot/", {"day": day_id, "order": int(order)})
     sid = int(res["id"])
-    log(f"    [slot] order={order} id={sid}")
+    log("    [slot] order=%s id=%s", order, sid)
     return sid
 
+# Flipped off once the server answers 400 rejecting `order` on a slot entry.
+# Day uploads run on worker threads, so the flip happens under a lock.
+_ENTRY_ORDER_OK = True
+_ENTRY_ORDER_LOCK = threading.Lock()
+
+def _rejects_order(e: Exception) -> bool:
+    """True for a 400 response whose body complains about the `order` field."""
+    r = getattr(e, "response", None)
+    return r is not None and r.status_code == 400 and "order" in r.text
+
 def create_slot_entry(endpoints: Dict[str, str], slot_id: int, exercise_id: int, order: int) -> Tuple[str, int]:
     """
     Try /slot-entry/ (preferred), retry without order if needed, else fallback /slotconfig/.
     Returns (link_kind, link_id) where link_kind in {"slot-entry","slotconfig"}.
     """
+    global _ENTRY_ORDER_OK
     if "slot-entry" in endpoints:
         try:
+            if not _ENTRY_ORDER_OK:
+                raise RuntimeError("server rejected `order` on an earlier slot entry")
             res = POST("/slot-entry/", {"slot": slot_id, "exercise": exercise_id, "order": int(order)}, ok=(201,))
-            sid = int(res["id"]); log(f"      [entry] slot_entry_id={sid} ex={exercise_id}")
+            sid = int(res["id"]); log("      [entry] slot_entry_id=%s ex=%s", sid, exercise_id)
             return ("slot-entry", sid)
-        except Exception:
+        except Exception as first:
+            # Only an explicit rejection of `order` drops it for the rest of the
+            # run; a transient failure affects this entry alone.
+            if _rejects_order(first):
+                with _ENTRY_ORDER_LOCK:
+                    _ENTRY_ORDER_OK = False
             try:
                 res = POST("/slot-entry/", {"slot": slot_id, "exercise": exercise_id}, ok=(201,))
-                sid = int(res["id"]); log(f"      [entry] slot_entry_id={sid} ex={exercise_id} (no order)")
+                sid = int(res["id"]); log("      [entry] slot_entry_id=%s ex=%s (no order)", sid, exercise_id)
                 return ("slot-entry", sid)
             except Exception as e:
-                log(f"      [WARN] /slot-entry/ failed twice; trying /slotconfig/ ({e})")
+                log("      [WARN] /slot-entry/ failed twice; trying /slotconfig/ (%s)", e)
     if "slotconfig" in endpoints:
         res = POST("/slotconfig/", {"slot": slot_id, "exercise": exercise_id}, ok=(201,))
-        scid = int(res["id"]); log(f"      [entry] slot_config_id={scid} ex={exercise_id}")
+        scid = int(res["id"]); log("      [entry] slot_config_id=%s ex=%s", scid, exercise_id)
         return ("slotconfig", scid)
     raise RuntimeError("Server lacks both /slot-entry/ and /slotconfig/.")
 
 # ---------- Config writers (with required `iteration`) ----------
 
+# (config path, link kind) -> FK name the server accepted last time
+_CONFIG_FK: Dict[Tuple[str, str], str] = {}
+
 def post_config_row(path: str, link_kind: str, link_id: int, value: Any, iteration: int = 1) -> None:
     """
     Public server requires `iteration`. Try common FK names; keep original on errors.
+    The FK that worked is tried first on later calls, so a mismatch costs one
+    failed POST per config kind rather than one per row.
     """
     fk_order = ["slot_entry","slot_config","slot"]
     pref = ["slot_entry","slot"] if link_kind == "slot-entry" else ["slot_config","slot"]
+    candidates = pref + [k for k in fk_order if k not in pref]
+    known = _CONFIG_FK.get((path, link_kind))
+    if known:
+        candidates = [known] + [k for k in candidates if k != known]
     tried = []
     last = None
-    for fk in pref + [k for k in fk_order if k not in pref]:
+    for fk in candidates:
         payload = {"value": value, "iteration": int(iteration), fk: link_id}
         try:
             POST(path, payload, ok=(201,))
+            _CONFIG_FK[(path, link_kind)] = fk
             return
         except Exception as e:
             tried.append(fk); last = e
-    log(f"        [WARN] Config POST {path} failed (tried {tried}): {last}")
+    log("        [WARN] Config POST %s failed (tried %s): %s", path, tried, last)
 
 def set_configs(link_kind: str, link_id: int,
                 sets: Optional[int], reps: Optional[Tuple[int, Optional[int]]],
@@ -315,57 +401,74 @@ def set_configs(link_kind: str, link_id: int,
 
 # ---------- Build from plan ----------
 
-def build_from_plan(plan_path: str) -> None:
-    log(f"[wger] Base URL: {BASE}")
-    log(f"[wger] Dry run: NO")
-    log(f"[wger] Reading plan: {plan_path}")
+def build_day(rid: int, order: int, day: Dict[str, Any],
+              endpoints: Dict[str, str], name_index: Dict[str, List[int]]) -> int:
+    """Create one workout day with its slots, entries and configs; returns the day id."""
+    _log_context.day = order
+    try:
+        return _build_day(rid, order, day, endpoints, name_index)
+    finally:
+        _log_context.day = None
+
+def _build_day(rid: int, order: int, day: Dict[str, Any],
+               endpoints: Dict[str, str], name_index: Dict[str, List[int]]) -> int:
+    did = create_day(routine_id=rid, order=order, name=day["name"], is_rest=bool(day["is_rest"]))
+    if day["is_rest"]:
+        return did
+
+    slots = day.get("slots") or [{"order": 1, "exercises": day.get("exercises", [])}]
+    for si, slot in enumerate(slots, start=1):
+        sid = create_slot(day_id=did, order=int(slot.get("order") or si))
+
+        items = slot.get("exercises") or slot.get("items") or []
+        for ei, item in enumerate(items, start=1):
+            ex_id = item.get("exercise_id")
+            if not ex_id:
+                name = item.get("name") or item.get("exercise_name")
+                if not name:
+                    log("      [WARN] Skipping: missing 'name' or 'exercise_id'")
+                    continue
+                ex_id = resolve_exercise_id(name_index, name)
+                if not ex_id:
+                    log("      [WARN] Could not resolve exercise_id for '%s'. Skipping.", name)
+                    continue
+
+            link_kind, link_id = create_slot_entry(endpoints, slot_id=sid, exercise_id=int(ex_id), order=ei)
+
+            sets = item.get("sets"); sets = int(sets) if sets is not None else None
+            reps = parse_reps(item.get("reps"))
+            weight = item.get("weight")
+            if weight is not None:
+                try: weight = float(weight)
+                except: weight = None
+            rir = int(item.get("rir")) if item.get("rir") is not None else None
+            rest_sec = item.get("rest") or item.get("rest_seconds") or item.get("rest_sec")
+            if rest_sec is not None:
+                try: rest_sec = int(rest_sec)
+                except: rest_sec = None
+
+            # iteration=1 baseline; further progressions can be added later
+            set_configs(link_kind, link_id, sets=sets, reps=reps, weight=weight, rir=rir, rest_sec=rest_sec, iteration=1)
+    return did
+
+def build_from_plan(plan_path: str, workers: int = MAX_WORKERS, live_index: bool = False) -> None:
+    log("[wger] Base URL: %s", BASE)
+    log("[wger] Dry run: NO")
+    log("[wger] Reading plan: %s", plan_path)
 
     start, end, days = load_plan(plan_path)
     endpoints = discover_endpoints()
 
-    name_index, _ = build_exercise_index(language_id=2)
+    name_index, _ = build_exercise_index(language_id=2, use_catalog=not live_index)
 
     rid = create_routine(start=start, end=end, description="", fit_in_week=False)
 
-    # Build days → slots → entries
-    for di, day in enumerate(days, start=1):
-        did = create_day(routine_id=rid, order=di, name=day["name"], is_rest=bool(day["is_rest"]))
-        if day["is_rest"]:
-            continue
-
-        slots = day.get("slots") or [{"order": 1, "exercises": day.get("exercises", [])}]
-        for si, slot in enumerate(slots, start=1):
-            sid = create_slot(day_id=did, order=int(slot.get("order") or si))
-
-            items = slot.get("exercises") or slot.get("items") or []
-            for ei, item in enumerate(items, start=1):
-                ex_id = item.get("exercise_id")
-                if not ex_id:
-                    name = item.get("name") or item.get("exercise_name")
-                    if not name:
-                        log("      [WARN] Skipping: missing 'name' or 'exercise_id'")
-                        continue
-                    ex_id = resolve_exercise_id(name_index, name)
-                    if not ex_id:
-                        log(f"      [WARN] Could not resolve exercise_id for '{name}'. Skipping.")
-                        continue
-
-                link_kind, link_id = create_slot_entry(endpoints, slot_id=sid, exercise_id=int(ex_id), order=ei)
-
-                sets = item.get("sets"); sets = int(sets) if sets is not None else None
-                reps = parse_reps(item.get("reps"))
-                weight = item.get("weight")
-                if weight is not None:
-                    try: weight = float(weight)
-                    except: weight = None
-                rir = int(item.get("rir")) if item.get("rir") is not None else None
-                rest_sec = item.get("rest") or item.get("rest_seconds") or item.get("rest_sec")
-                if rest_sec is not None:
-                    try: rest_sec = int(rest_sec)
-                    except: rest_sec = None
-
-                # iteration=1 baseline; further progressions can be added later
-                set_configs(link_kind, link_id, sets=sets, reps=reps, weight=weight, rir=rir, rest_sec=rest_sec, iteration=1)
+    # Days carry an explicit order, so they are independent and can be
+    # uploaded concurrently over the pooled session. map() keeps results in
+    # plan order and re-raises the first failure.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        list(ex.map(lambda job: build_day(rid, job[0], job[1], endpoints, name_index),
+                    enumerate(days, start=1)))
 
     log("[OK] Routine build completed.")
 
@@ -374,8 +477,12 @@ def build_from_plan(plan_path: str) -> None:
 def main():
     ap = argparse.ArgumentParser(description="Apply a plan JSON to wger Routine API (public server compatible)")
     ap.add_argument("plan", help="Path to plan JSON")
+    ap.add_argument("--workers", type=int, default=MAX_WORKERS, help="Days uploaded concurrently (1 = serial)")
+    ap.add_argument("--live-index", action="store_true",
+                    help="Resolve exercise names against /exerciseinfo/ instead of the local catalog")
     args = ap.parse_args()
-    build_from_plan(args.plan)
+    logging.basicConfig(format="%(message)s", level=logging.INFO)
+    build_from_plan(args.plan, workers=args.workers, live_index=args.live_index)
 
 if __name__ == "__main__":
     main()
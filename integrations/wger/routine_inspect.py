@@ -1,28 +1,40 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os, sys, time, requests
+import json, os, sys
 from typing import Dict, Any, List, Optional
 
+import urllib3
+from urllib3.util.retry import Retry
+
 BASE = (os.environ.get("WGER_BASE_URL") or "https://wger.de/api/v2").rstrip("/")
 API_KEY = (os.environ.get("WGER_API_KEY") or "").strip()
 HDRS = {"Accept":"application/json","Content-Type":"application/json"}
 if API_KEY: HDRS["Authorization"] = f"Token {API_KEY}"
 
-def req(method: str, url: str, params=None, ok=(200,), tries=2, backoff=0.5):
-    last = None
-    for i in range(tries):
-        r = requests.request(method, url, headers=HDRS, params=params, timeout=60)
-        if r.status_code in ok: return r
-        last = r
-        if 500 <= r.status_code < 600 and i < tries-1:
-            time.sleep(backoff); continue
-        r.raise_for_status()
-    last.raise_for_status(); return last
+# Read-only, single-host client: a bare urllib3 pool (keep-alive, retries on
+# throttling/5xx) avoids the per-call Request/Session machinery of requests.
+POOL = urllib3.PoolManager(
+    num_pools=1, maxsize=8, headers=HDRS, timeout=urllib3.Timeout(total=60),
+    retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  raise_on_status=False),
+)
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def req(method: str, url: str, params=None, ok=(200,)):
+    r = POOL.request(method, url, fields=params)
+    if r.status not in ok:
+        body = r.data.decode("utf-8", "replace")[:800]
+        raise HTTPError(r.status, f"{r.status} error for {method} {url}: {body}")
+    return r
 
 def GET(p: str, params=None):
     url = p if p.startswith("http") else f"{BASE}{p}"
-    return req("GET", url, params=params, ok=(200,)).json()
+    return json.loads(req("GET", url, params=params, ok=(200,)).data)
 
 # ---------- helpers for numeric parsing & printing ----------
 
@@ -45,30 +57,26 @@ def fmt_num(x: Optional[float]) -> str:
 
 # ---------- basic fetchers ----------
 
-def get_days(routine_id: int) -> List[Dict[str,Any]]:
-    out, url = [], f"/day/?routine={routine_id}&limit=100"
+def get_all(url: str) -> List[Dict[str,Any]]:
+    out = []
     while url:
         page = GET(url)
         out += page.get("results", [])
         url = page.get("next") or ""
+    return out
+
+def get_days(routine_id: int) -> List[Dict[str,Any]]:
+    out = get_all(f"/day/?routine={routine_id}&limit=100")
     out.sort(key=lambda d: d.get("order", 0))
     return out
 
 def get_slots(day_id: int) -> List[Dict[str,Any]]:
-    out, url = [], f"/slot/?day={day_id}&limit=100"
-    while url:
-        page = GET(url)
-        out += page.get("results", [])
-        url = page.get("next") or ""
+    out = get_all(f"/slot/?day={day_id}&limit=100")
     out.sort(key=lambda s: s.get("order", 0))
     return out
 
 def get_slot_entries(slot_id: int) -> List[Dict[str,Any]]:
-    out, url = [], f"/slot-entry/?slot={slot_id}&limit=100"
-    while url:
-        page = GET(url)
-        out += page.get("results", [])
-        url = page.get("next") or ""
+    out = get_all(f"/slot-entry/?slot={slot_id}&limit=100")
     out.sort(key=lambda e: e.get("order", 0))
     return out
 
@@ -107,6 +115,54 @@ def cfg_for_slot_config(path: str, slot_config_id: int) -> Optional[float]:
     row = pick_iter(res, 1)
     return parse_num(row.get("value")) if row else None
 
+CONFIG_PATHS = (
+    "/sets-config/", "/repetitions-config/", "/max-repetitions-config/",
+    "/weight-config/", "/rir-config/", "/rest-config/",
+)
+
+# Cleared the first time the server rejects (or ignores) the slot_entry__in
+# filter; from then on configs are fetched one slot entry at a time.
+_BULK_CONFIGS = True
+
+def _bulk_configs(path: str, ids: List[int]) -> Optional[Dict[int, List[Dict[str,Any]]]]:
+    """All config rows of one kind for many slot entries, or None if unsupported."""
+    global _BULK_CONFIGS
+    wanted = set(ids)
+    by_entry: Dict[int, List[Dict[str,Any]]] = {}
+    url = f"{path}?slot_entry__in={','.join(map(str, sorted(wanted)))}&limit=1000"
+    try:
+        while url:
+            page = GET(url)
+            for row in page.get("results", []):
+                seid = row.get("slot_entry")
+                if seid not in wanted:
+                    # Unknown filters are silently dropped by the API; don't page the world.
+                    _BULK_CONFIGS = False
+                    return None
+                by_entry.setdefault(int(seid), []).append(row)
+            url = page.get("next") or ""
+    except HTTPError as e:
+        if e.status != 400:
+            raise
+        _BULK_CONFIGS = False
+        return None
+    return by_entry
+
+def configs_for_entries(path: str, ids: List[int]) -> Dict[int, Optional[float]]:
+    """Iteration-1 value of one config kind per slot entry, one request when possible."""
+    if _BULK_CONFIGS and ids:
+        rows = _bulk_configs(path, ids)
+        if rows is not None:
+            out = {}
+            for seid in ids:
+                row = pick_iter(rows.get(seid, []), 1)
+                out[seid] = parse_num(row.get("value")) if row else None
+            return out
+    return {seid: cfg_for_slot_entry(path, seid) for seid in ids}
+
+SLOT_LINE = "  Slot {} id={}{}".format
+ENTRY_LINE = "    • {} (ex={})  sets={} reps={} wt={} RIR={} rest={}s".format
+
 def summarize_routine(routine_id: int):
     print(f"[inspect] routine_id={routine_id} @ {BASE}")
     days = get_days(routine_id)
@@ -115,24 +171,24 @@ def summarize_routine(routine_id: int):
         is_rest = bool(d.get("is_rest", False))
         print(f"\nDAY {d.get('order',0)} — {name}  (rest={is_rest})")
         if is_rest: continue
-        slots = get_slots(did)
-        for s in slots:
+        slots = [(s, get_slot_entries(s["id"])) for s in get_slots(did)]
+
+        # One request per config kind for the whole day instead of one per entry.
+        entry_ids = [int(e["id"]) for _, entries in slots for e in entries]
+        day_cfgs = {path: configs_for_entries(path, entry_ids) for path in CONFIG_PATHS}
+
+        lines = []
+        for s, entries in slots:
             sid = s["id"]; order = s.get("order",0)
-            entries = get_slot_entries(sid)
             superset = " (SUPERSET)" if len(entries) > 1 else ""
-            print(f"  Slot {order} id={sid}{superset}")
+            lines.append(SLOT_LINE(order, sid, superset))
             for e in entries:
                 seid = int(e["id"])
                 ex_id = int(e["exercise"])
                 exn = exercise_name(ex_id)
 
                 # configs from slot_entry; if missing, try slot_config
-                sets = cfg_for_slot_entry("/sets-config/", seid)
-                reps_lo = cfg_for_slot_entry("/repetitions-config/", seid)
-                reps_hi = cfg_for_slot_entry("/max-repetitions-config/", seid)
-                weight  = cfg_for_slot_entry("/weight-config/", seid)
-                rir     = cfg_for_slot_entry("/rir-config/", seid)
-                rest    = cfg_for_slot_entry("/rest-config/", seid)
+                sets, reps_lo, reps_hi, weight, rir, rest = (day_cfgs[path][seid] for path in CONFIG_PATHS)
 
                 if all(v is None for v in (sets, reps_lo, reps_hi, weight, rir, rest)):
                     scid = find_slotconfig_id(sid, ex_id)
@@ -151,7 +207,10 @@ def summarize_routine(routine_id: int):
                     else:
                         reps_str = fmt_num(reps_lo)
 
-                print(f"    • {exn} (ex={ex_id})  sets={fmt_num(sets)} reps={reps_str} wt={fmt_num(weight)} RIR={fmt_num(rir)} rest={fmt_num(rest)}s")
+                lines.append(ENTRY_LINE(exn, ex_id, fmt_num(sets), reps_str, fmt_num(weight), fmt_num(rir), fmt_num(rest)))
+        # One write per day rather than one per entry.
+        if lines:
+            print("\n".join(lines))
 
 if __name__ == "__main__":
     rid = int(sys.argv[1]) if len(sys.argv) > 1 else 0
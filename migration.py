@@ -15,7 +15,10 @@ Key fixes in this version:
 
 import json
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import psycopg
@@ -43,21 +46,62 @@ PROJECT_ROOT = get_project_root()
 sys.path.append(str(PROJECT_ROOT))
 
 from pete_e.config import settings
+from pete_e.infra.json_utils import read_json
 
 
 def load_json_catalog(catalog_path: Path, filename: str) -> list:
     """A helper to load JSON and handle potential errors."""
     file_path = catalog_path / filename
-    if not file_path.exists():
+    try:
+        return read_json(file_path)
+    except FileNotFoundError:
         logging.warning(f"Catalog file not found: {file_path}")
         return []
-    try:
-        return json.loads(file_path.read_text("utf-8"))
     except json.JSONDecodeError as e:
         logging.error(f"Error decoding JSON from {file_path}: {e}")
         return []
 
+def copy_merge(cur: psycopg.Cursor, table: str, columns, key, rows, update: bool = True) -> int:
+    """
+    Bulk-load ``rows`` into ``table`` via COPY into a temporary staging table,
+    then merge with a single INSERT ... SELECT ... ON CONFLICT (key).
+
+    Non-key columns are overwritten when ``update`` is true (DO UPDATE), so a
+    re-run refreshes changed rows instead of failing on duplicate keys;
+    otherwise existing rows are left alone (DO NOTHING). Returns the number
+    of rows inserted or updated.
+    """
+    stage = f"{table}_stage"
+    cols = ", ".join(columns)
+    cur.execute(f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP;")
+    with cur.copy(f"COPY {stage} ({cols}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+    updates = [c for c in columns if c not in key]
+    if update and updates:
+        action = "DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in updates)
+    else:
+        action = "DO NOTHING"
+    cur.execute(
+        f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {stage} "
+        f"ON CONFLICT ({', '.join(key)}) {action};"
+    )
+    return cur.rowcount
+
+
 # --- Wger Catalog Migration ---
+def load_simple_catalog(cur: psycopg.Cursor, table: str, columns, items: list):
+    """
+    Upsert a flat catalog (categories, equipment, muscles) keyed on ``id``.
+    The catalog JSON uses the column names as its keys, so rows are read
+    straight off each item.
+    """
+    if not items:
+        return
+    copy_merge(cur, table, columns, ("id",), (tuple(map(item.get, columns)) for item in items))
+    logging.info(f"Populated {table} with {len(items)} entries.")
+
 def populate_wger_catalog(cur: psycopg.Cursor):
     """
     Populates all Wger-related catalog tables from their JSON sources.
@@ -71,29 +115,18 @@ def populate_wger_catalog(cur: psycopg.Cursor):
     muscles_data = load_json_catalog(catalog_path, "muscles.json")
     exercises_data = load_json_catalog(catalog_path, "exercises_en.json")
 
-    # Create lookup maps for names to IDs
+    # Create lookup maps for names to IDs straight from the parsed catalog.
+    # Exercises name their muscles `name_en or name` (see catalog_refresh.py),
+    # so key the muscle map the same way or muscles without an English name
+    # (e.g. Brachialis, Soleus) never link.
     category_map = {item['name']: item['id'] for item in categories_data}
     equipment_map = {item['name']: item['id'] for item in equipment_data}
-    muscle_map = {item['name_en']: item['id'] for item in muscles_data if item.get('name_en')}
+    muscle_map = {(item.get('name_en') or item['name']): item['id'] for item in muscles_data}
 
     # 2. Populate simple dimension tables
-    if categories_data:
-        with cur.copy("COPY wger_category (id, name) FROM STDIN") as copy:
-            for cat in categories_data:
-                copy.write_row((cat["id"], cat["name"]))
-        logging.info(f"Populated wger_category with {len(categories_data)} entries.")
-
-    if equipment_data:
-        with cur.copy("COPY wger_equipment (id, name) FROM STDIN") as copy:
-            for item in equipment_data:
-                copy.write_row((item["id"], item["name"]))
-        logging.info(f"Populated wger_equipment with {len(equipment_data)} entries.")
-
-    if muscles_data:
-        with cur.copy("COPY wger_muscle (id, name, name_en, is_front) FROM STDIN") as copy:
-            for muscle in muscles_data:
-                copy.write_row((muscle["id"], muscle["name"], muscle.get("name_en"), muscle["is_front"]))
-        logging.info(f"Populated wger_muscle with {len(muscles_data)} entries.")
+    load_simple_catalog(cur, "wger_category", ("id", "name"), categories_data)
+    load_simple_catalog(cur, "wger_equipment", ("id", "name"), equipment_data)
+    load_simple_catalog(cur, "wger_muscle", ("id", "name", "name_en", "is_front"), muscles_data)
 
     # 3. Populate exercises and their junction tables
     if exercises_data:
@@ -102,53 +135,89 @@ def populate_wger_catalog(cur: psycopg.Cursor):
         primary_muscle_rows = []
         secondary_muscle_rows = []
 
+        # Bind the hot lookups once; the loop below runs for every exercise.
+        category_get = category_map.get
+        equipment_get = equipment_map.get
+        muscle_get = muscle_map.get
+
         for ex in exercises_data:
             cat_name = ex.get("category")
-            if not cat_name or cat_name not in category_map:
+            category_id = category_get(cat_name) if cat_name else None
+            if category_id is None:
                 logging.warning(f"Skipping exercise '{ex.get('name')}' due to missing or unknown category '{cat_name}'.")
                 continue
 
-            category_id = category_map[cat_name]
-            exercise_rows.append((ex["id"], ex["uuid"], ex["name"], ex.get("description_html"), category_id))
+            ex_id = ex["id"]
+            exercise_rows.append((ex_id, ex["uuid"], ex["name"], ex.get("description_html"), category_id))
 
-            for equip_name in ex.get("equipment", []):
-                if equip_name in equipment_map:
-                    equipment_rows.append((ex["id"], equipment_map[equip_name]))
+            equipment_rows.extend(
+                (ex_id, eid) for name in ex.get("equipment", ()) if (eid := equipment_get(name)) is not None
+            )
+            primary_muscle_rows.extend(
+                (ex_id, mid) for name in ex.get("muscles_primary", ()) if (mid := muscle_get(name)) is not None
+            )
+            secondary_muscle_rows.extend(
+                (ex_id, mid) for name in ex.get("muscles_secondary", ()) if (mid := muscle_get(name)) is not None
+            )
 
-            for muscle_name in ex.get("muscles_primary", []):
-                if muscle_name in muscle_map:
-                    primary_muscle_rows.append((ex["id"], muscle_map[muscle_name]))
+        # COPY + merge, so re-running against a populated catalog upserts
+        copy_merge(cur, "wger_exercise", ("id", "uuid", "name", "description", "category_id"),
+                   ("id",), exercise_rows)
+        copy_merge(cur, "wger_exercise_equipment", ("exercise_id", "equipment_id"),
+                   ("exercise_id", "equipment_id"), equipment_rows)
+        copy_merge(cur, "wger_exercise_muscle_primary", ("exercise_id", "muscle_id"),
+                   ("exercise_id", "muscle_id"), primary_muscle_rows)
+        copy_merge(cur, "wger_exercise_muscle_secondary", ("exercise_id", "muscle_id"),
+                   ("exercise_id", "muscle_id"), secondary_muscle_rows)
 
-            for muscle_name in ex.get("muscles_secondary", []):
-                if muscle_name in muscle_map:
-                    secondary_muscle_rows.append((ex["id"], muscle_map[muscle_name]))
+        logging.info(f"Populated wger_exercise and related tables with {len(exercise_rows)} valid entries.")
 
-        # Use COPY for bulk inserts
-        with cur.copy("COPY wger_exercise (id, uuid, name, description, category_id) FROM STDIN") as copy:
-            for row in exercise_rows:
-                copy.write_row(row)
-        
-        with cur.copy("COPY wger_exercise_equipment (exercise_id, equipment_id) FROM STDIN") as copy:
-            for row in equipment_rows:
-                copy.write_row(row)
+    logging.info("Wger catalog population complete.")
 
-        with cur.copy("COPY wger_exercise_muscle_primary (exercise_id, muscle_id) FROM STDIN") as copy:
-            for row in primary_muscle_rows:
-                copy.write_row(row)
 
-        with cur.copy("COPY wger_exercise_muscle_secondary (exercise_id, muscle_id) FROM STDIN") as copy:
-            for row in secondary_muscle_rows:
-                copy.write_row(row)
+# --- Daily Data Migration ---
+DAILY_SUMMARY_COLUMNS = (
+    "summary_date", "weight_kg", "body_fat_pct", "muscle_mass_kg", "water_pct",
+    "steps", "exercise_minutes", "calories_active", "calories_resting", "stand_minutes", "distance_m",
+    "hr_resting", "hr_avg", "hr_max", "hr_min",
+    "sleep_total_minutes", "sleep_asleep_minutes", "sleep_rem_minutes",
+    "sleep_deep_minutes", "sleep_core_minutes", "sleep_awake_minutes",
+)
 
-        logging.info(f"Populated wger_exercise and related tables with {len(exercise_rows)} valid entries.")
+# Source keys for each daily_summary column group, in DAILY_SUMMARY_COLUMNS order.
+_BODY_KEYS = ("weight_kg", "body_fat_pct", "muscle_mass_kg", "water_pct")
+_HEART_KEYS = ("resting_bpm", "avg_bpm", "max_bpm", "min_bpm")
+_SLEEP_KEYS = (
+    "total_minutes", "asleep_minutes", "rem_minutes",
+    "deep_minutes", "core_minutes", "awake_minutes",
+)
 
-    logging.info("Wger catalog population complete.")
+# Secondary indexes on strength_log (see init-db/schema.sql), and the load size
+# at which dropping and recreating them beats per-row index maintenance.
+STRENGTH_LOG_INDEXES = {
+    "idx_strength_log_summary_date": "strength_log(summary_date)",
+    "idx_strength_log_exercise_id": "strength_log(exercise_id)",
+}
+STRENGTH_INDEX_REBUILD_ROWS = 5000
+
+
+def _read_daily_file(file_path: Path):
+    """Parse one daily file, returning (path, data, error) so a bad file doesn't stop the pool."""
+    try:
+        return file_path, read_json(file_path), None
+    except Exception as e:
+        return file_path, None, e
 
 
-# --- Daily Data Migration ---
 def migrate_daily_summaries(cur: psycopg.Cursor):
     """
-    Iterates through all daily JSON files and inserts them into the database.
+    Iterates through all daily JSON files and bulk-loads them into the database.
+
+    Rows are collected in memory first, then written with COPY: summaries go
+    through a temporary staging table so existing dates are still skipped
+    (ON CONFLICT DO NOTHING), and strength sets are copied straight in.
+    Files for dates already in daily_summary are not even parsed, which also
+    keeps a re-run from duplicating their strength sets.
     """
     logging.info("Starting migration of daily summary files...")
     daily_path = PROJECT_ROOT / "knowledge/daily"
@@ -156,79 +225,96 @@ def migrate_daily_summaries(cur: psycopg.Cursor):
         logging.error(f"Daily knowledge directory not found at: {daily_path}")
         return
 
-    json_files = sorted(daily_path.glob("*.json"))
-    logging.info(f"Found {len(json_files)} daily summary files to process.")
-
-    for file_path in json_files:
-        try:
-            data = json.loads(file_path.read_text("utf-8"))
-            summary_date = data.get("date")
-            if not summary_date:
-                logging.warning(f"Skipping file with no date: {file_path}")
+    cur.execute("SELECT summary_date FROM daily_summary;")
+    done = {row[0].isoformat() for row in cur.fetchall()}
+
+    with os.scandir(daily_path) as it:
+        names = sorted(
+            e.name for e in it
+            if e.name.endswith(".json") and e.name[:-5] not in done and e.is_file()
+        )
+    logging.info(f"Found {len(names)} daily summary files to process ({len(done)} dates already migrated).")
+
+    summary_rows = []
+    strength_rows = []
+
+    # Reading and parsing are independent per file, so overlap them on a small
+    # thread pool; rows are still assembled (and later COPY'd) on this thread.
+    paths = [daily_path / name for name in names]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for file_path, data, error in pool.map(_read_daily_file, paths):
+            if error is not None:
+                logging.error(f"An unexpected error occurred processing {file_path.name}: {error}")
                 continue
-
-            # --- Insert into daily_summary ---
-            body = data.get("body", {})
-            apple = data.get("activity", {})
-            heart = data.get("heart", {})
-            sleep = data.get("sleep", {})
-
-            # --- THIS IS THE NEW LOGIC ---
-            # Convert distance from km to m
-            distance_m = None
-            if apple.get("distance_km") is not None:
-                try:
-                    distance_m = int(float(apple.get("distance_km")) * 1000)
-                except (ValueError, TypeError):
-                    distance_m = None
-
-            cur.execute(
-                """
-                INSERT INTO daily_summary (
-                    summary_date, weight_kg, body_fat_pct, muscle_mass_kg, water_pct,
-                    steps, exercise_minutes, calories_active, calories_resting, stand_minutes, distance_m,
-                    hr_resting, hr_avg, hr_max, hr_min,
-                    sleep_total_minutes, sleep_asleep_minutes, sleep_rem_minutes,
-                    sleep_deep_minutes, sleep_core_minutes, sleep_awake_minutes
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (summary_date) DO NOTHING;
-                """,
-                (
+            try:
+                summary_date = data.get("date")
+                if not summary_date:
+                    logging.warning(f"Skipping file with no date: {file_path}")
+                    continue
+                if summary_date in done:
+                    continue
+
+                # --- daily_summary row ---
+                body = data.get("body", {})
+                apple = data.get("activity", {})
+                heart = data.get("heart", {})
+                sleep = data.get("sleep", {})
+
+                # Convert distance from km to m
+                distance_m = None
+                if apple.get("distance_km") is not None:
+                    try:
+                        distance_m = int(float(apple.get("distance_km")) * 1000)
+                    except (ValueError, TypeError):
+                        distance_m = None
+
+                calories = apple.get("calories", {})
+                summary_rows.append((
                     summary_date,
-                    body.get("weight_kg"), body.get("body_fat_pct"), body.get("muscle_mass_kg"), body.get("water_pct"),
+                    *map(body.get, _BODY_KEYS),
                     apple.get("steps"), apple.get("exercise_minutes"),
-                    apple.get("calories", {}).get("active"), apple.get("calories", {}).get("resting"),
+                    calories.get("active"), calories.get("resting"),
                     apple.get("stand_minutes"), distance_m,
-                    heart.get("resting_bpm"), heart.get("avg_bpm"), heart.get("max_bpm"), heart.get("min_bpm"),
-                    sleep.get("total_minutes"), sleep.get("asleep_minutes"), sleep.get("rem_minutes"),
-                    sleep.get("deep_minutes"), sleep.get("core_minutes"), sleep.get("awake_minutes")
-                ),
-            )
-
-            # --- Insert into strength_log ---
-            strength_logs = data.get("strength", [])
-            for log in strength_logs:
-                exercise_id = log.get("exercise_id")
-                reps_list = log.get("reps", [])
-                weights_list = log.get("weights_kg", [])
-
-                if len(reps_list) == len(weights_list):
-                    for i in range(len(reps_list)):
-                        cur.execute(
-                            """
-                            INSERT INTO strength_log (summary_date, exercise_id, reps, weight_kg, rir)
-                            VALUES (%s, %s, %s, %s, %s);
-                            """,
-                            (summary_date, exercise_id, reps_list[i], weights_list[i], None),
+                    *map(heart.get, _HEART_KEYS),
+                    *map(sleep.get, _SLEEP_KEYS),
+                ))
+
+                # --- strength_log rows ---
+                for log in data.get("strength", []):
+                    exercise_id = log.get("exercise_id")
+                    reps_list = log.get("reps", [])
+                    weights_list = log.get("weights_kg", [])
+
+                    if len(reps_list) == len(weights_list):
+                        # One row per set, pairing reps and weights positionally.
+                        strength_rows.extend(
+                            zip(repeat(summary_date), repeat(exercise_id), reps_list, weights_list, repeat(None))
                         )
-                else:
-                    logging.warning(f"Mismatched reps/weights for ex {exercise_id} on {summary_date}. Skipping.")
-
-        except psycopg.Error as e:
-             logging.error(f"Database error processing {file_path.name}: {e}")
-        except Exception as e:
-            logging.error(f"An unexpected error occurred processing {file_path.name}: {e}")
-
+                    else:
+                        logging.warning(f"Mismatched reps/weights for ex {exercise_id} on {summary_date}. Skipping.")
+
+            except Exception as e:
+                logging.error(f"An unexpected error occurred processing {file_path.name}: {e}")
+
+    if summary_rows:
+        inserted = copy_merge(cur, "daily_summary", DAILY_SUMMARY_COLUMNS, ("summary_date",),
+                              summary_rows, update=False)
+        logging.info(f"Inserted {inserted} of {len(summary_rows)} daily summaries.")
+
+    if strength_rows:
+        # For a big load it's cheaper to rebuild the secondary indexes once than
+        # to maintain them row by row; small top-up runs keep them in place.
+        rebuild = len(strength_rows) >= STRENGTH_INDEX_REBUILD_ROWS
+        if rebuild:
+            for name in STRENGTH_LOG_INDEXES:
+                cur.execute(f"DROP INDEX IF EXISTS {name};")
+        with cur.copy("COPY strength_log (summary_date, exercise_id, reps, weight_kg, rir) FROM STDIN") as copy:
+            for row in strength_rows:
+                copy.write_row(row)
+        if rebuild:
+            for name, target in STRENGTH_LOG_INDEXES.items():
+                cur.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target};")
+        logging.info(f"Copied {len(strength_rows)} strength sets into strength_log.")
 
     logging.info("Daily summary migration complete.")
 
@@ -246,6 +332,9 @@ def main():
     try:
         with psycopg.connect(settings.DATABASE_URL) as conn:
             with conn.cursor() as cur:
+                # Everything below commits once at the end; a one-off bulk load
+                # doesn't need to wait on the WAL flush for that commit.
+                cur.execute("SET LOCAL synchronous_commit = OFF;")
                 populate_wger_catalog(cur)
                 migrate_daily_summaries(cur)
 
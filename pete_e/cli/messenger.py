@@ -15,11 +15,7 @@ from datetime import date
 
 from pete_e.config import settings
 from pete_e.core.orchestrator import Orchestrator
-from pete_e.data_access.json_dal import JsonDal
-try:
-    from pete_e.data_access.postgres_dal import PostgresDal
-except Exception:  # pragma: no cover - Postgres optional
-    PostgresDal = None
+from pete_e.data_access.factory import get_dal
 from pete_e.infra.telegram_sender import send_telegram_message
 from pete_e.infra import log_utils
 
@@ -43,23 +39,10 @@ def main():
     log_utils.log_message(f"Messenger CLI invoked for '{args.type}' report.", "INFO")
 
     # 1. Initialize dependencies
-    # We instantiate the DAL here and pass it to the orchestrator.
+    # We fetch the shared DAL here and pass it to the orchestrator.
     # This is Dependency Injection! The orchestrator doesn't know or
     # care which DAL implementation it's using.
-    if (
-        PostgresDal
-        and settings.DATABASE_URL
-        and settings.ENVIRONMENT == "production"
-    ):
-        try:
-            dal = PostgresDal()
-        except Exception as e:
-            log_utils.log_message(
-                f"Postgres DAL init failed: {e}. Falling back to JSON.", "WARN"
-            )
-            dal = JsonDal()
-    else:
-        dal = JsonDal()
+    dal = get_dal()
     orchestrator = Orchestrator(dal)
 
     # 2. Generate the report content using the orchestrator
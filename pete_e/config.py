@@ -7,6 +7,7 @@ through a singleton `settings` object.
 """
 
 import os
+from functools import cached_property
 from urllib.parse import quote_plus
 from pathlib import Path
 from typing import Optional
@@ -41,6 +42,9 @@ class Settings(BaseSettings):
     WITHINGS_REFRESH_TOKEN: str
     WGER_API_KEY: str
     WGER_API_URL: str = "https://wger.de/api/v2"
+    # Reuse a still-valid Withings access token between runs (needs a
+    # persistent, private PROJECT_ROOT/.cache directory).
+    WITHINGS_TOKEN_CACHE: bool = False
 
     # --- DATABASE (from environment) ---
     POSTGRES_USER: Optional[str] = None
@@ -68,6 +72,9 @@ class Settings(BaseSettings):
     RECOVERY_SLEEP_THRESHOLD_MINUTES: int = 420  # 7 hours
     RECOVERY_RHR_THRESHOLD: int = 60  # bpm
 
+    # --- SYNC ---
+    SYNC_TTL_SECONDS: int = 300  # reuse a successful sync this recent
+
     def __init__(self, **values):
         super().__init__(**values)
         # --- THIS LOGIC IS UPDATED ---
@@ -85,41 +92,54 @@ class Settings(BaseSettings):
 
 
     # --- FILE PATHS (derived from PROJECT_ROOT) ---
-    @property
+    # Computed on first access and kept on the instance; __setattr__ drops
+    # them again whenever PROJECT_ROOT is reassigned.
+    @cached_property
     def log_path(self) -> Path:
         return self.PROJECT_ROOT / "summaries/logs/pete_history.log"
 
-    @property
+    @cached_property
     def lift_log_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/lift_log.json"
 
-    @property
+    @cached_property
     def history_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/history.json"
 
-    @property
+    @cached_property
     def daily_knowledge_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/daily"
 
-    @property
+    @cached_property
     def wger_catalog_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/wger"
 
-    @property
-    def phrases_path(self) -> Path:
-        return self.PROJECT_ROOT / "knowledge/phrases.json"
-
-    @property
+    @cached_property
     def wger_plans_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/wger/plans"
 
-    @property
+    @cached_property
     def body_age_path(self) -> Path:
         return self.PROJECT_ROOT / "knowledge/body_age.json"
 
-    @property
+    @cached_property
+    def withings_token_cache_path(self) -> Path:
+        return self.PROJECT_ROOT / ".cache/withings_token.json"
+
+    @cached_property
     def phrases_path(self) -> Path:
         return self.PROJECT_ROOT / "resources" / "phrases_tagged.json"
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "PROJECT_ROOT":
+            for attr in _DERIVED_PATHS:
+                self.__dict__.pop(attr, None)
+
+
+_DERIVED_PATHS = tuple(
+    name for name, attr in vars(Settings).items() if isinstance(attr, cached_property)
+)
+
 # Create a single, importable instance of the settings
 settings = Settings()
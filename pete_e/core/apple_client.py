@@ -3,8 +3,13 @@ Apple Health client for Pete-E
 Refactored from write_apple.py – no legacy artefacts, returns clean dicts.
 """
 
+import re
 from datetime import date
 
+# Plain decimal numbers ("1234", "-5", "7.5", ".5"), the common case; anything
+# else still goes through float() so "1e3", "1_000", "nan" and "inf" parse too.
+_NUM = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)")
+
 
 def clean_num(v, as_int: bool = True):
     """Convert a value to int/float safely, or return None."""
@@ -13,7 +18,13 @@ def clean_num(v, as_int: bool = True):
     if isinstance(v, (int, float)):
         return int(v) if as_int else float(v)
 
+    # Sparse fields mostly arrive as ""; reject that without raising.
     s = str(v).replace(",", "").strip()
+    if not s:
+        return None
+    if _NUM.fullmatch(s) is not None:
+        f = float(s)
+        return int(f) if as_int else f
     try:
         return int(float(s)) if as_int else float(s)
     except Exception:
@@ -2,7 +2,11 @@
 Body Age calculation for Pete-E.
 """
 
+import copy
+import heapq
+from bisect import bisect_left
 from datetime import date
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
 
@@ -22,46 +26,46 @@ def average(values: List[Optional[float]]) -> Optional[float]:
     return sum(vals) / len(vals) if vals else None
 
 
-def calculate_body_age(
-    withings_history: List[Dict[str, Any]],
-    apple_history: List[Dict[str, Any]],
-    profile: Dict[str, Any],
-) -> Dict[str, Any]:
-    """Compute body age using rolling 7-day averages."""
-    today = date.today().isoformat()
-
-    # Collect unique dates from both sources
-    dates = sorted({r.get("date") for r in withings_history + apple_history if r.get("date")})
-    if not dates:
-        return {"date": today, "error": "No input data"}
-    dates = dates[-7:]
+# Metrics averaged over the 7-day window, as used by the score: (name, key
+# path into a history record).
+FIELDS = (
+    ("fat_percent", ("fat_percent",)),
+    ("steps", ("steps",)),
+    ("exercise_minutes", ("exercise_minutes",)),
+    ("hr_resting", ("heart_rate", "resting")),
+    ("sleep_asleep", ("sleep", "asleep")),
+)
 
-    # Helper to extract averages from merged records
-    def avg_from(fn):
-        vals = [to_float(fn(r)) for r in withings_history + apple_history if r.get("date") in dates]
-        return average(vals)
 
-    weight = avg_from(lambda r: r.get("weight"))
-    bodyfat = avg_from(lambda r: r.get("fat_percent"))
-    steps = avg_from(lambda r: r.get("steps"))
-    exmin = avg_from(lambda r: r.get("exercise_minutes"))
-
-    c_act = avg_from(lambda r: r.get("calories", {}).get("active") if isinstance(r.get("calories"), dict) else None)
-    c_rest = avg_from(lambda r: r.get("calories", {}).get("resting") if isinstance(r.get("calories"), dict) else None)
-    c_total = avg_from(lambda r: r.get("calories", {}).get("total") if isinstance(r.get("calories"), dict) else None)
+def _field(record: Dict[str, Any], path: tuple) -> Any:
+    """Follow ``path`` through nested dicts, returning None where it breaks."""
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
 
-    rhr = avg_from(lambda r: r.get("heart_rate", {}).get("resting") if isinstance(r.get("heart_rate"), dict) else None)
-    hravg = avg_from(lambda r: r.get("heart_rate", {}).get("avg") if isinstance(r.get("heart_rate"), dict) else None)
 
-    sleepm = avg_from(lambda r: r.get("sleep", {}).get("asleep") if isinstance(r.get("sleep"), dict) else None)
+# Resting-HR ladder: upper bounds (inclusive) and the score for each band;
+# anything above the last bound scores RHR_SCORES[-1].
+RHR_BOUNDS = (55, 60, 70, 80)
+RHR_SCORES = (90, 80, 60, 40, 20)
 
-    chrono_age = profile.get("age", 40)
 
+def _compose_scores(
+    chrono_age: float,
+    bodyfat: Optional[float],
+    steps: Optional[float],
+    exmin: Optional[float],
+    rhr: Optional[float],
+    sleepm: Optional[float],
+) -> tuple:
+    """Turn the averaged inputs into (crf, body_comp, activity, recovery, composite)."""
     # Cardiorespiratory fitness (CRF) proxy
-    vo2 = None
     if rhr is not None:
         vo2 = 38 - 0.15 * (chrono_age - 40) - 0.15 * ((rhr or 60) - 60) + 0.01 * (exmin or 0)
-    if vo2 is None:
+    else:
         vo2 = 35
     crf = max(0, min(100, ((vo2 - 20) / (60 - 20) * 100)))
 
@@ -87,23 +91,90 @@ def calculate_body_age(
         diff = abs(sleepm - 450)  # 7.5h = 450 minutes
         sleep_score = max(0, min(100, 100 - (diff / 150) * 60))
 
-    if rhr is None:
-        rhr_score = 50  # neutral default if missing
-    elif rhr <= 55:
-        rhr_score = 90
-    elif rhr <= 60:
-        rhr_score = 80
-    elif rhr <= 70:
-        rhr_score = 60
-    elif rhr <= 80:
-        rhr_score = 40
-    else:
-        rhr_score = 20
+    # Neutral default if missing, else the band rhr falls into
+    rhr_score = 50 if rhr is None else RHR_SCORES[bisect_left(RHR_BOUNDS, rhr)]
 
     recovery = 0.66 * sleep_score + 0.34 * rhr_score
 
     # Composite body age score
     composite = 0.40 * crf + 0.25 * body_comp + 0.20 * activity + 0.15 * recovery
+    return crf, body_comp, activity, recovery, composite
+
+
+# Last computed result keyed by _fingerprint(); repeated narrative runs on the
+# same data skip the recomputation.
+_RESULT_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def calculate_body_age(
+    withings_history: List[Dict[str, Any]],
+    apple_history: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Compute body age using rolling 7-day averages."""
+    key = _fingerprint(withings_history, apple_history, profile)
+    cached = _RESULT_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    # Collect unique dates from both sources; only the latest 7 matter
+    unique = {d for r in chain(withings_history, apple_history) if (d := r.get("date"))}
+    if not unique:
+        return {"date": date.today().isoformat(), "error": "No input data"}
+
+    result = _body_age_for(withings_history, apple_history, profile, unique)
+    _RESULT_CACHE.clear()  # only the latest inputs are worth keeping
+    _RESULT_CACHE[key] = result
+    return copy.deepcopy(result)
+
+
+def _fingerprint(
+    withings_history: List[Dict[str, Any]],
+    apple_history: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+) -> tuple:
+    """
+    Cheap identity for a body-age input: sizes plus the newest record of each
+    source (re-synced values for the latest day change its repr) and the age.
+    """
+    return (
+        len(withings_history),
+        len(apple_history),
+        repr(withings_history[-1]) if withings_history else None,
+        repr(apple_history[-1]) if apple_history else None,
+        profile.get("age", 40),
+    )
+
+
+def _body_age_for(
+    withings_history: List[Dict[str, Any]],
+    apple_history: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+    unique: set,
+) -> Dict[str, Any]:
+    """The body-age computation proper, over histories known to have dates."""
+    dates = sorted(heapq.nlargest(7, unique))
+    window = frozenset(dates)
+
+    # Filter the window once, then read every metric off those records in order
+    relevant = [r for r in chain(withings_history, apple_history) if r.get("date") in window]
+    values: Dict[str, List[Optional[float]]] = {name: [] for name, _ in FIELDS}
+    for r in relevant:
+        for name, path in FIELDS:
+            values[name].append(to_float(_field(r, path)))
+    avgs = {name: average(vals) for name, vals in values.items()}
+
+    bodyfat = avgs["fat_percent"]
+    steps = avgs["steps"]
+    exmin = avgs["exercise_minutes"]
+    rhr = avgs["hr_resting"]
+    sleepm = avgs["sleep_asleep"]
+
+    chrono_age = profile.get("age", 40)
+
+    crf, body_comp, activity, recovery, composite = _compose_scores(
+        chrono_age, bodyfat, steps, exmin, rhr, sleepm
+    )
     body_age = chrono_age - 0.2 * (composite - 50)
 
     # Cap improvements to -10 years
@@ -5,6 +5,28 @@ from typing import Any, Dict, List
 from pete_e.data_access.dal import DataAccessLayer
 
 
+def _set_entries(
+    exercise_id: int,
+    weight: float,
+    reps: int,
+    sets: int,
+    rir: int | None = None,
+    log_date: str | None = None,
+) -> List[Dict[str, Any]]:
+    """Expand one logged exercise into a row per set."""
+    log_dt = date.fromisoformat(log_date) if log_date else date.today()
+    entry = {
+        "exercise_id": exercise_id,
+        "log_date": log_dt,
+        "reps": reps,
+        "weight_kg": weight,
+        "rir": rir,
+    }
+    # Wger workout logs are one row per set and carry no set count.
+    count = 1 if sets is None else sets
+    return [dict(entry) for _ in range(count)]
+
+
 def append_log_entry(
     dal: DataAccessLayer,
     exercise_id: int,
@@ -15,15 +37,29 @@ def append_log_entry(
     log_date: str | None = None,
 ) -> None:
     """Persist a strength training entry using the DAL."""
-    log_dt = date.fromisoformat(log_date) if log_date else date.today()
-    for _ in range(sets):
-        dal.save_strength_log_entry(
-            exercise_id=exercise_id,
-            log_date=log_dt,
-            reps=reps,
-            weight_kg=weight,
-            rir=rir,
-        )
+    dal.save_strength_log_entries(
+        _set_entries(exercise_id, weight, reps, sets, rir=rir, log_date=log_date)
+    )
+
+
+def append_log_entries(
+    dal: DataAccessLayer, logs_by_date: Dict[str, List[Dict[str, Any]]]
+) -> None:
+    """Persist every set of a ``{date: [log, ...]}`` mapping in one DAL write."""
+    entries: List[Dict[str, Any]] = []
+    for d, logs_list in logs_by_date.items():
+        for log in logs_list:
+            entries.extend(
+                _set_entries(
+                    exercise_id=log.get("exercise_id"),
+                    weight=log.get("weight"),
+                    reps=log.get("reps"),
+                    sets=log.get("sets"),
+                    rir=log.get("rir"),
+                    log_date=d,
+                )
+            )
+    dal.save_strength_log_entries(entries)
 
 
 def get_history_for_exercise(
@@ -32,11 +68,6 @@ def get_history_for_exercise(
     """
     Retrieves history for an exercise using the provided DAL.
     """
-    # Use the DAL to load the data
-    log = dal.load_lift_log()
-    entries = log.get(str(exercise_id), [])
-    
-    if last_n:
-        return entries[-last_n:]
-    return entries
+    # Ask the DAL for just this exercise rather than the whole log
+    return dal.load_lift_history(exercise_id, last_n)
 
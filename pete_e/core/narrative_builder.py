@@ -1,9 +1,15 @@
+import heapq
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pete_e.core.phrase_picker import random_phrase as phrase_for
 from pete_e.core.narrative_utils import stitch_sentences
 from pete_e.config import settings
 
+# Report openers, built once at import rather than per report
+DAILY_GREETINGS = ("Morning mate 👋", "Morning Ric 🌞", "Hey Ric, ready for today?")
+WEEKLY_GREETINGS = ("Howdy Ric 🤠", "Ey up Ric 👋", "Another week down, mate!")
+CYCLE_GREETINGS = ("Ey up Ric 👋", "Cycle wrap-up time 🔄", "Alright Ric, here’s how the block went 💪")
+
 
 def compare_text(current, previous, unit="", context=""):
     """Return chatty comparative text instead of robotic % changes."""
@@ -26,12 +32,12 @@ def build_daily_narrative(metrics: dict) -> str:
     if not days:
         return "Morning mate 👋\n\nNo logs found for yesterday. Did you rest? 😴"
 
-    all_dates = sorted(days.keys())
-    yesterday = all_dates[-1]
-    today_data = days[yesterday]
-    prev_data = days.get(all_dates[-2]) if len(all_dates) > 1 else {}
+    # Only the two most recent days matter; no need to sort the whole map.
+    latest = heapq.nlargest(2, days)
+    today_data = days[latest[0]]
+    prev_data = days.get(latest[1]) if len(latest) > 1 else {}
 
-    greeting = random.choice(["Morning mate 👋", "Morning Ric 🌞", "Hey Ric, ready for today?"])
+    greeting = random.choice(DAILY_GREETINGS)
 
     insights = []
 
@@ -74,8 +80,7 @@ def build_weekly_narrative(metrics: dict) -> str:
     if not days:
         return "Howdy Ric 🤠\n\nNo logs found for last week. Rest week?"
 
-    today = datetime.utcnow().date()
-    all_dates = sorted(days.keys())
+    today = datetime.now(timezone.utc).date()
 
     last_week = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(1, 8)]
     prev_week = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(8, 15)]
@@ -83,7 +88,7 @@ def build_weekly_narrative(metrics: dict) -> str:
     week_data = [days[d] for d in last_week if d in days]
     prev_data = [days[d] for d in prev_week if d in days]
 
-    greeting = random.choice(["Howdy Ric 🤠", "Ey up Ric 👋", "Another week down, mate!"])
+    greeting = random.choice(WEEKLY_GREETINGS)
 
     insights = []
 
@@ -125,7 +130,7 @@ def build_cycle_narrative(metrics: dict) -> str:
     cycle_data = [days[d] for d in all_dates[-cycle_days:]]
     prev_cycle = [days[d] for d in all_dates[-2 * cycle_days:-cycle_days]] if len(all_dates) > cycle_days else []
 
-    greeting = random.choice(["Ey up Ric 👋", "Cycle wrap-up time 🔄", "Alright Ric, here’s how the block went 💪"])
+    greeting = random.choice(CYCLE_GREETINGS)
 
     insights = []
 
@@ -1,7 +1,8 @@
 import random
+from itertools import chain
 
 # 🔗 Pete’s conversational glue
-CONNECTORS = [
+CONNECTORS = (
     "mate,", "listen,", "honestly,", "you know what?",
     "I swear,", "look,", "trust me,", "real talk,",
     "hear me out,", "no joke,", "straight up,", "let me tell ya,",
@@ -17,10 +18,10 @@ CONNECTORS = [
     "in the annals of leg day,", "arm day chronicles,",
     "bro science says,", "peer-reviewed by Pete,", "your muscles requested,",
     "science optional,", "gainz committee reports,", "straight from the creatine cloud,",
-]
+)
 
 # 🏁 Pete’s dramatic sign-offs
-CLOSERS = [
+CLOSERS = (
     "Keep grinding or the gains train leaves without you 🚂💪",
     "Hakuna matata and heavy squatta 🦁🏋️",
     "No excuses, just sets and juices 🥤💪",
@@ -60,10 +61,10 @@ CLOSERS = [
     "You pressed so hard Newton updated physics 📚",
     "Your sweat just got its own IMDb credit 🎬",
     "Congrats, you broke the space-time flex continuum ⏳💥",
-]
+)
 
 # 💥 Chaos one-liners
-ONE_LINERS = [
+ONE_LINERS = (
     "DOMS = proof you exist 💥",
     "Burpees? More like slurpees 🥤",
     "Your quads stomp harder than Godzilla in heels 🦖",
@@ -84,7 +85,7 @@ ONE_LINERS = [
     "Traps visible from space 🛰️",
     "Muscles louder than your playlist 🎧",
     "Your PR is now Pete’s bedtime story 📖",
-]
+)
 
 
 def stitch_sentences(insights: list[str], sprinkles: list[str], short_mode: bool = False) -> str:
@@ -95,17 +96,15 @@ def stitch_sentences(insights: list[str], sprinkles: list[str], short_mode: bool
     if short_mode or random.random() < 0.08:
         return random.choice(ONE_LINERS)
 
-    text = []
-    if insights:
-        text.append(f"Mate, {insights[0]} — not bad at all.")
+    opener = (f"Mate, {insights[0]} — not bad at all.",) if insights else ()
 
-    for part in insights[1:]:
-        connector = random.choice(CONNECTORS)
-        text.append(f"{connector} {part}")
+    # Every follow-up line gets a connector; draw them all in one call
+    parts = insights[1:] + [s.lower() for s in sprinkles]
+    connectors = random.choices(CONNECTORS, k=len(parts))
+    closer = random.choice(CLOSERS)
 
-    for s in sprinkles:
-        connector = random.choice(CONNECTORS)
-        text.append(f"{connector} {s.lower()}")
-
-    text.append(random.choice(CLOSERS))
-    return " ".join(text)
+    return " ".join(chain(
+        opener,
+        (f"{connector} {part}" for connector, part in zip(connectors, parts)),
+        (closer,),
+    ))
@@ -8,6 +8,7 @@ the DataAccessLayer (DAL) that is injected during its initialization.
 """
 
 from datetime import date, timedelta
+from itertools import islice
 from typing import Optional
 
 # Import the abstract DAL, not a concrete implementation
@@ -22,6 +23,13 @@ from . import validation
 from . import plan_builder
 
 
+# Where each averaged metric lives inside a daily summary
+METRIC_PATHS = {
+    "rhr": ("apple", "heart_rate", "resting"),
+    "sleep": ("apple", "sleep", "asleep"),
+}
+
+
 class Orchestrator:
     """Orchestrates high-level operations using the DAL."""
 
@@ -92,12 +100,11 @@ class Orchestrator:
         self.current_start_date = start_date
 
         plan_builder.build_block(self.dal, start_date)
-        log_utils.log_message(
-            f"New 4-week plan generated starting {start_date.isoformat()}", "INFO"
-        )
+        start_iso = start_date.isoformat()
+        log_utils.log_message(f"New 4-week plan generated starting {start_iso}", "INFO")
 
         # For now, we return a simple message. Later, this could summarize the plan.
-        return f"✅ New 4-week training cycle planned, starting {start_date.isoformat()}."
+        return f"✅ New 4-week training cycle planned, starting {start_iso}."
 
 
     # --- INTERNAL HELPER METHODS ---
@@ -105,19 +112,25 @@ class Orchestrator:
 
     def _get_metric_values(self, history: dict, metric: str, days: int) -> list:
         """Extracts metric values from the last N days of history."""
-        # This logic remains the same, but the `history` object it receives
-        # is now guaranteed to have come from the DAL.
-        last_n = list(history.values())[-days:]
+        # The `history` object it receives is guaranteed to have come from the DAL.
+        if metric not in METRIC_PATHS:
+            return []
+        *parents, leaf = METRIC_PATHS[metric]
+        # Read only the tail: walk the newest N days backwards, then restore order.
+        # days <= 0 keeps the old ``[-days:]`` slice meaning (0 = every day).
+        tail = (
+            islice(reversed(history.values()), days)
+            if days > 0
+            else reversed(list(history.values())[-days:])
+        )
         vals = []
-        for day_data in last_n:
-            v = None
-            if metric == "rhr":
-                v = day_data.get("apple", {}).get("heart_rate", {}).get("resting")
-            elif metric == "sleep":
-                v = day_data.get("apple", {}).get("sleep", {}).get("asleep")
-            
+        for day_data in tail:
+            for key in parents:
+                day_data = day_data.get(key, {})
+            v = day_data.get(leaf)
             if v is not None:
                 vals.append(v)
+        vals.reverse()
         return vals
 
     def _average(self, history: dict, metric: str, days: int) -> Optional[float]:
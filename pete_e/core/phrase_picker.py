@@ -1,27 +1,82 @@
-import json
 import random
+from typing import Optional
 
 # Import centralized components
 from pete_e.config import settings
+from pete_e.infra.json_utils import loads
 from pete_e.infra.log_utils import log_message
 
 # Global cache for phrases to avoid repeated file reads
 _all_phrases = None
 
+# Phrase mode -> selection bucket used by random_phrase()
+_MODE_BUCKET = {
+    "motivational": "serious",
+    "coachism": "serious",
+    "silly": "chaotic",
+    "portmanteau": "chaotic",
+    "metaphor": "chaotic",
+}
+
 
 def load_phrases():
     """Load phrases from JSON into memory (cached)."""
     global _all_phrases
     if _all_phrases is None:
         phrases_path = settings.phrases_path
-        if not phrases_path.exists():
+        try:
+            raw = phrases_path.read_bytes()
+        except FileNotFoundError:
             log_message(f"Missing phrases file at {phrases_path}", "ERROR")
             # Return an empty list to prevent crashes, but log the error
             return []
-        _all_phrases = json.loads(phrases_path.read_text(encoding="utf-8"))
+        _all_phrases = loads(raw)
     return _all_phrases
 
 
+# (kind, tagset) -> pools built by _pools(), valid only for _pool_bank;
+# a reset or reloaded phrase bank starts a fresh cache.
+_pool_cache: dict = {}
+_pool_bank = None
+
+
+def _pools(kind: str, tagset: Optional[frozenset]) -> tuple:
+    """
+    Split the phrase bank for one kind/tag filter into
+    (legendary, filtered, serious, chaotic) tuples, built once per filter.
+    """
+    global _pool_bank
+    phrases = load_phrases()
+    if phrases is not _pool_bank:
+        _pool_cache.clear()
+        _pool_bank = phrases
+    key = (kind, tagset)
+    if key not in _pool_cache:
+        _pool_cache[key] = _build_pools(phrases, kind, tagset)
+    return _pool_cache[key]
+
+
+def _build_pools(phrases: list, kind: str, tagset: Optional[frozenset]) -> tuple:
+    """Filter ``phrases`` by tags or kind and bucket the result by mode."""
+    legendary = tuple(p for p in phrases if (p.get("mode") or "").lower() == "legendary")
+
+    # Filter by tags
+    if tagset:
+        phrases = [p for p in phrases if not tagset.isdisjoint(p.get("tags", []))]
+
+    # Filter by kind (only if tags not used)
+    elif kind != "any":
+        phrases = [p for p in phrases if kind == (p.get("kind") or "").lower()]
+
+    # Mode selection
+    buckets = {"serious": [], "chaotic": []}
+    for p in phrases:
+        bucket = _MODE_BUCKET.get((p.get("mode") or "").lower())
+        if bucket:
+            buckets[bucket].append(p)
+    return legendary, tuple(phrases), tuple(buckets["serious"]), tuple(buckets["chaotic"])
+
+
 def random_phrase(kind="any", mode="balanced", tags=None) -> str:
     """
     Pick a random phrase from Pete’s arsenal.
@@ -34,24 +89,14 @@ def random_phrase(kind="any", mode="balanced", tags=None) -> str:
     if not phrases:
         return "No phrases available. Check logs for errors."
 
+    legendary, phrases, serious, chaotic = _pools(
+        kind, frozenset(tags) if tags else None
+    )
+
     # 1% chance to drop a legendary easter egg
-    legendary = [p for p in phrases if (p.get("mode") or "").lower() == "legendary"]
     if legendary and random.random() < 0.01:
         return random.choice(legendary)["text"]
 
-    # Filter by tags
-    if tags:
-        tagset = set(tags)
-        phrases = [p for p in phrases if tagset & set(p.get("tags", []))]
-
-    # Filter by kind (only if tags not used)
-    elif kind != "any":
-        phrases = [p for p in phrases if kind == (p.get("kind") or "").lower()]
-
-    # Mode selection
-    serious = [p for p in phrases if (p.get("mode") or "").lower() in ("motivational", "coachism")]
-    chaotic = [p for p in phrases if (p.get("mode") or "").lower() in ("silly", "portmanteau", "metaphor")]
-
     if mode == "serious":
         phrases = serious
     elif mode == "chaotic":
@@ -1,7 +1,7 @@
 """Lightweight training plan builder."""
 
 from datetime import date, timedelta
-from statistics import mean
+from statistics import fmean
 from typing import Dict, List
 
 from pete_e.data_access.dal import DataAccessLayer
@@ -22,9 +22,11 @@ def build_block(dal: DataAccessLayer, start_date: date) -> Dict[str, List[Dict]]
 
     rhrs = [m.get("apple", {}).get("heart_rate", {}).get("resting") for m in recent_metrics]
     sleeps = [m.get("apple", {}).get("sleep", {}).get("asleep") for m in recent_metrics]
+    rhrs = [r for r in rhrs if r is not None]
+    sleeps = [s for s in sleeps if s is not None]
 
-    avg_rhr = mean([r for r in rhrs if r is not None]) if rhrs else None
-    avg_sleep = mean([s for s in sleeps if s is not None]) if sleeps else None
+    avg_rhr = fmean(rhrs) if rhrs else None
+    avg_sleep = fmean(sleeps) if sleeps else None
 
     recovery_good = (
         bool(lift_log)
@@ -1,6 +1,6 @@
 """Adaptive weight progression logic using the Data Access Layer."""
 
-from statistics import mean
+from statistics import fmean
 from typing import Tuple
 
 from pete_e.data_access.dal import DataAccessLayer
@@ -10,7 +10,38 @@ from pete_e.config import settings
 def _average(values: list[float]) -> float:
     """Return the mean of a list, or 0 if empty."""
 
-    return mean(values) if values else 0.0
+    return fmean(values) if values else 0.0
+
+
+def _recovery_averages(metrics: list[dict]) -> Tuple[float, float]:
+    """Mean resting HR and sleep minutes, walking each day's ``apple`` dict once."""
+    rhrs: list[float] = []
+    sleeps: list[float] = []
+    for m in metrics:
+        apple = m.get("apple", {})
+        rhr = apple.get("heart_rate", {}).get("resting")
+        if rhr is not None:
+            rhrs.append(rhr)
+        asleep = apple.get("sleep", {}).get("asleep")
+        if asleep is not None:
+            sleeps.append(asleep)
+    return _average(rhrs), _average(sleeps)
+
+
+_NO_HISTORY = object()
+_NO_WEIGHTS = object()
+
+
+def _history_stats(entries: list[dict]):
+    """(avg weight, avg RIR or None) over the last four sets, or a no-data marker."""
+    if not entries:
+        return _NO_HISTORY
+    last_entries = entries[-4:]
+    weights = [e.get("weight") for e in last_entries if e.get("weight") is not None]
+    rirs = [e.get("rir") for e in last_entries if e.get("rir") is not None]
+    if not weights:
+        return _NO_WEIGHTS
+    return fmean(weights), (fmean(rirs) if rirs else None)
 
 
 def apply_progression(
@@ -18,24 +49,24 @@ def apply_progression(
 ) -> Tuple[dict, list[str]]:
     """Adjust weights based on lift log and recovery metrics."""
 
+    # Nothing to adjust (e.g. a deload or rest-only week): skip the lift log
+    # and metric fetches entirely.
+    if not any(
+        session.get("exercises")
+        for day in week.get("days", [])
+        for session in day.get("sessions", [])
+        if session.get("type") == "weights"
+    ):
+        return week, []
+
     if lift_history is None:
         lift_history = dal.load_lift_log()
 
     recent_metrics = dal.get_historical_metrics(7)
     baseline_metrics = dal.get_historical_metrics(settings.BASELINE_DAYS)
 
-    rhr_7 = _average(
-        [m.get("apple", {}).get("heart_rate", {}).get("resting") for m in recent_metrics if m.get("apple", {}).get("heart_rate", {}).get("resting") is not None]
-    )
-    sleep_7 = _average(
-        [m.get("apple", {}).get("sleep", {}).get("asleep") for m in recent_metrics if m.get("apple", {}).get("sleep", {}).get("asleep") is not None]
-    )
-    rhr_baseline = _average(
-        [m.get("apple", {}).get("heart_rate", {}).get("resting") for m in baseline_metrics if m.get("apple", {}).get("heart_rate", {}).get("resting") is not None]
-    )
-    sleep_baseline = _average(
-        [m.get("apple", {}).get("sleep", {}).get("asleep") for m in baseline_metrics if m.get("apple", {}).get("sleep", {}).get("asleep") is not None]
-    )
+    rhr_7, sleep_7 = _recovery_averages(recent_metrics)
+    rhr_baseline, sleep_baseline = _recovery_averages(baseline_metrics)
 
     recovery_good = True
     if rhr_baseline and sleep_baseline:
@@ -43,6 +74,9 @@ def apply_progression(
             recovery_good = False
 
     adjustments: list[str] = []
+    # The same lift recurs on many days of a block; its history is fixed for
+    # this call, so summarise each exercise's last sets only once.
+    history_stats: dict = {}
 
     for day in week.get("days", []):
         for session in day.get("sessions", []):
@@ -52,26 +86,22 @@ def apply_progression(
                 ex_id = str(ex.get("id"))
                 name = ex.get("name", f"Exercise #{ex_id}")
 
-                entries = lift_history.get(ex_id, [])
-                if not entries:
+                if ex_id not in history_stats:
+                    history_stats[ex_id] = _history_stats(lift_history.get(ex_id, []))
+                stats = history_stats[ex_id]
+                if stats is _NO_HISTORY:
                     adjustments.append(
                         f"{name}: no history, kept at {ex.get('weight_target', 0)}kg"
                     )
                     continue
-
-                last_entries = entries[-4:]
-                weights = [e.get("weight") for e in last_entries if e.get("weight") is not None]
-                rirs = [e.get("rir") for e in last_entries if e.get("rir") is not None]
-
-                if not weights:
+                if stats is _NO_WEIGHTS:
                     adjustments.append(
                         f"{name}: no valid weight data, kept at {ex.get('weight_target', 0)}kg"
                     )
                     continue
 
-                avg_weight = mean(weights)
-                use_rir = bool(rirs)
-                avg_rir = mean(rirs) if use_rir else None
+                avg_weight, avg_rir = stats
+                use_rir = avg_rir is not None
 
                 target = ex.get("weight_target", avg_weight)
                 inc = settings.PROGRESSION_INCREMENT
@@ -1,5 +1,6 @@
 import time
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
 # Import centralized components
 from pete_e.config import settings
@@ -10,27 +11,10 @@ from pete_e.core.withings_client import WithingsClient
 from integrations.wger.client import WgerClient
 from pete_e.core import apple_client, body_age, lift_log
 from pete_e.data_access.dal import DataAccessLayer
-from pete_e.data_access.json_dal import JsonDal
-try:
-    from pete_e.data_access.postgres_dal import PostgresDal
-except Exception:  # pragma: no cover - optional
-    PostgresDal = None
+from pete_e.data_access.factory import get_dal
 
-
-def _get_dal() -> DataAccessLayer:
-    """Select the appropriate DAL based on environment settings."""
-    if (
-        PostgresDal
-        and settings.DATABASE_URL
-        and settings.ENVIRONMENT == "production"
-    ):
-        try:
-            return PostgresDal()
-        except Exception as e:  # pragma: no cover - fallback
-            log_utils.log_message(
-                f"Postgres DAL init failed: {e}. Falling back to JSON.", "WARN"
-            )
-    return JsonDal()
+# (dal, time.monotonic()) of the last successful run_sync_with_retries
+_last_success: tuple[DataAccessLayer, float] | None = None
 
 
 def run_sync(dal: DataAccessLayer) -> tuple[bool, list[str]]:
@@ -49,9 +33,15 @@ def run_sync(dal: DataAccessLayer) -> tuple[bool, list[str]]:
     apple_data = {}
     wger_data = {}
 
+    # Both remote fetches are independent network waits; start them together
+    # and collect the results (or exceptions) in the usual order below.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        withings_future = pool.submit(withings_client.get_summary, days_back=1)
+        wger_future = pool.submit(wger_client.get_logs_by_date, days=1)
+
     # --- Withings ---
     try:
-        withings_data = withings_client.get_summary(target_date=today - timedelta(days=1))
+        withings_data = withings_future.result()
         log_utils.log_message(f"[sync] Withings data fetched: {withings_data}", "INFO")
     except Exception as e:
         log_utils.log_message(f"[sync] Withings fetch failed: {e}", "ERROR")
@@ -70,22 +60,12 @@ def run_sync(dal: DataAccessLayer) -> tuple[bool, list[str]]:
 
     # --- Wger Logs ---
     try:
-        wger_data = wger_client.get_logs(days=1)
+        wger_data = wger_future.result()
         log_utils.log_message(
             f"[sync] Wger logs fetched: {len(wger_data.get(today_iso, []))} entries",
             "INFO",
         )
-        for d, logs_list in wger_data.items():
-            for log in logs_list:
-                lift_log.append_log_entry(
-                    dal=dal,
-                    exercise_id=log.get("exercise_id"),
-                    weight=log.get("weight"),
-                    reps=log.get("reps"),
-                    sets=log.get("sets"),
-                    rir=log.get("rir"),
-                    log_date=d,
-                )
+        lift_log.append_log_entries(dal, wger_data)
     except Exception as e:
         log_utils.log_message(f"[sync] Wger fetch failed: {e}", "ERROR")
         failed_sources.append("Wger")
@@ -96,7 +76,7 @@ def run_sync(dal: DataAccessLayer) -> tuple[bool, list[str]]:
     # --- Body Age ---
     try:
         body_age_result = body_age.calculate_body_age(
-            [withings_data, apple_data], profile={"age": 40}
+            [withings_data], [apple_data], profile={"age": 40}
         )
         log_utils.log_message(f"[sync] Body Age calculated: {body_age_result}", "INFO")
     except Exception as e:
@@ -120,10 +100,21 @@ def run_sync_with_retries(
     dal: DataAccessLayer | None = None, retries: int = 3, delay: int = 60
 ) -> bool:
     """Attempt to run the sync multiple times if it fails, selecting DAL if needed."""
-    dal = dal or _get_dal()
+    global _last_success
+    dal = dal or get_dal()
+    # Reports run back to back in one process share a recent successful sync,
+    # but only into the same DAL; any other store still gets its own sync.
+    if (
+        _last_success is not None
+        and _last_success[0] is dal
+        and time.monotonic() - _last_success[1] < settings.SYNC_TTL_SECONDS
+    ):
+        log_utils.log_message("[sync] Recent sync still fresh, skipping.", "INFO")
+        return True
     for i in range(retries):
         success, failed = run_sync(dal=dal)
         if success:
+            _last_success = (dal, time.monotonic())
             return True
         log_utils.log_message(
             f"[sync] Attempt {i + 1}/{retries} failed. Failed sources: {failed}. Retrying in {delay}s...",
@@ -35,34 +35,33 @@ def check_recovery(
     Returns:
         (adjusted_week, adjustment_logs)
     """
-    adjustments = []
-    global_backoff = False
-
-    if (
+    # Evaluate each recovery gate once, then build the notes from the flags
+    rhr_bad = bool(
         rhr_baseline
         and rhr_last_week
         and rhr_last_week > rhr_baseline * (1 + settings.RHR_ALLOWED_INCREASE)
-    ):
-        adjustments.append(
-            f"Global back-off: ↑ RHR >{int(settings.RHR_ALLOWED_INCREASE*100)}% baseline"
-        )
-        global_backoff = True
-
-    if (
+    )
+    sleep_bad = bool(
         sleep_baseline
         and sleep_last_week
         and sleep_last_week < sleep_baseline * settings.SLEEP_ALLOWED_DECREASE
-    ):
+    )
+    age_bad = body_age_delta > settings.BODY_AGE_ALLOWED_INCREASE
+    global_backoff = rhr_bad or sleep_bad or age_bad
+
+    adjustments = []
+    if rhr_bad:
+        adjustments.append(
+            f"Global back-off: ↑ RHR >{int(settings.RHR_ALLOWED_INCREASE*100)}% baseline"
+        )
+    if sleep_bad:
         adjustments.append(
             f"Global back-off: ↓ sleep <{int(settings.SLEEP_ALLOWED_DECREASE*100)}% baseline"
         )
-        global_backoff = True
-
-    if body_age_delta > settings.BODY_AGE_ALLOWED_INCREASE:
+    if age_bad:
         adjustments.append(
             f"Global back-off: body age worsened >{settings.BODY_AGE_ALLOWED_INCREASE} years"
         )
-        global_backoff = True
 
     if global_backoff:
         for day in week["days"]:
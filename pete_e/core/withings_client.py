@@ -4,14 +4,36 @@ Refactored from a procedural script to a class-based client.
 It uses a centralized configuration service for credentials.
 """
 
-import requests
+import time
 from datetime import datetime, timedelta, timezone
 
 # Import the centralized settings object
 from pete_e.config import settings
+from pete_e.infra import json_utils
+from pete_e.infra.http_utils import session_with_retries
 from pete_e.infra.log_utils import log_message
 
 
+SESSION = session_with_retries()
+
+
+# Withings measure type -> summary field (see `meastypes` below).
+MEASURE_FIELDS = ((1, "weight"), (6, "fat_percent"), (76, "muscle_mass"), (77, "water_percent"))
+
+
+def measures_to_row(group: dict) -> dict:
+    """Scale one measure group's values and map them onto the summary fields."""
+    mvals = {
+        m.get("type"): m["value"] * (10 ** m.get("unit", 0))
+        for m in group.get("measures", [])
+    }
+    row = {}
+    for type_id, field in MEASURE_FIELDS:
+        v = mvals.get(type_id)
+        row[field] = round(v, 2) if v is not None else None
+    return row
+
+
 class WithingsClient:
     """A client to interact with the Withings API."""
 
@@ -25,8 +47,38 @@ class WithingsClient:
         self.token_url = "https://wbsapi.withings.net/v2/oauth2"
         self.measure_url = "https://wbsapi.withings.net/measure"
 
+    def _load_cached_token(self):
+        """Return the cached access token if it is still valid, else None."""
+        try:
+            cached = json_utils.read_json(settings.withings_token_cache_path)
+        except (OSError, ValueError):
+            return None
+        if time.time() < cached.get("expires_at", 0):
+            return cached.get("access_token")
+        return None
+
+    def _store_cached_token(self, token: str, expires_in: int) -> None:
+        """Persist the access token with a safety margin before its expiry."""
+        path = settings.withings_token_cache_path
+        try:
+            # Owner-only from creation: the token is never world-readable
+            json_utils.write_json(
+                path,
+                {"access_token": token, "expires_at": time.time() + expires_in - 60},
+                mode=0o600,
+            )
+        except OSError as e:
+            log_message(f"Could not write Withings token cache: {e}", "WARN")
+
     def _refresh_access_token(self):
         """Exchanges the refresh token for a new access token."""
+        if settings.WITHINGS_TOKEN_CACHE:
+            cached = self._load_cached_token()
+            if cached:
+                self.access_token = cached
+                log_message("Using cached Withings access token.", "INFO")
+                return
+
         log_message("Refreshing Withings access token.", "INFO")
         data = {
             "action": "requesttoken",
@@ -35,13 +87,16 @@ class WithingsClient:
             "client_secret": self.client_secret,
             "refresh_token": self.refresh_token,
         }
-        r = requests.post(self.token_url, data=data, timeout=30)
+        r = SESSION.post(self.token_url, data=data, timeout=30)
         r.raise_for_status()
         js = r.json()
         if js.get("status") != 0:
             raise RuntimeError(f"Withings token refresh failed: {js}")
         
         self.access_token = js["body"]["access_token"]
+        if settings.WITHINGS_TOKEN_CACHE:
+            # Withings access tokens live for ~3 hours (expires_in seconds).
+            self._store_cached_token(self.access_token, int(js["body"].get("expires_in", 10800)))
         log_message("Successfully refreshed Withings access token.", "INFO")
 
     def _fetch_measures(self, start: datetime, end: datetime) -> dict:
@@ -56,7 +111,7 @@ class WithingsClient:
             "startdate": int(start.timestamp()),
             "enddate": int(end.timestamp()),
         }
-        r = requests.get(
+        r = SESSION.get(
             self.measure_url,
             headers={"Authorization": f"Bearer {self.access_token}"},
             params=params,
@@ -73,6 +128,7 @@ class WithingsClient:
         tz = timezone.utc
         today = datetime.now(tz).date()
         target_date = today - timedelta(days=days_back)
+        day_iso = target_date.isoformat()
         start = datetime(target_date.year, target_date.month, target_date.day, tzinfo=tz)
         end = start + timedelta(days=1)
 
@@ -82,27 +138,15 @@ class WithingsClient:
 
         measures = js.get("body", {}).get("measuregrps", [])
         if not measures:
-            log_message(
-                f"No Withings measures found for {target_date.isoformat()}.", "WARN"
-            )
-            return {"date": target_date.isoformat()}
+            log_message(f"No Withings measures found for {day_iso}.", "WARN")
+            return {"date": day_iso}
 
-        latest = measures[-1]
-        row = {"date": target_date.isoformat()}
-
-        def val(type_id: int):
-            for m in latest.get("measures", []):
-                if m.get("type") == type_id:
-                    return m["value"] * (10 ** m.get("unit", 0))
-            return None
-
-        row["weight"] = round(val(1), 2) if val(1) is not None else None
-        row["fat_percent"] = round(val(6), 2) if val(6) is not None else None
-        row["muscle_mass"] = round(val(76), 2) if val(76) is not None else None
-        row["water_percent"] = round(val(77), 2) if val(77) is not None else None
+        row = {"date": day_iso}
+        row.update(measures_to_row(measures[-1]))
 
         log_message(
-            f"Successfully fetched Withings summary for {target_date.isoformat()}.",
+            f"Successfully fetched Withings summary for {day_iso}.",
             "INFO",
         )
         return row
+
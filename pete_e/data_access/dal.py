@@ -16,6 +16,18 @@ class DataAccessLayer(ABC):
         """Loads the entire lift log."""
         pass
 
+    def load_lift_history(
+        self, exercise_id: int, last_n: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns one exercise's entries in date order, optionally only the last N.
+
+        Backends that can query a single exercise override this; the default
+        slices the full lift log.
+        """
+        entries = self.load_lift_log().get(str(exercise_id), [])
+        return entries[-last_n:] if last_n else entries
+
     @abstractmethod
     def save_lift_log(self, log: Dict[str, Any]) -> None:
         """Saves the entire lift log."""
@@ -33,6 +45,16 @@ class DataAccessLayer(ABC):
         """Persists a single strength training set."""
         pass
 
+    def save_strength_log_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Persists many strength training sets in one go.
+
+        Each entry carries the keyword arguments of ``save_strength_log_entry``.
+        Backends override this to batch the write; the default saves one by one.
+        """
+        for entry in entries:
+            self.save_strength_log_entry(**entry)
+
     @abstractmethod
     def load_history(self) -> Dict[str, Any]:
         """Loads the consolidated history file."""
@@ -0,0 +1,33 @@
+"""
+Selects and shares the Data Access Layer for the current environment.
+
+Production runs with a DATABASE_URL use PostgreSQL; everything else (and any
+Postgres start-up failure) falls back to the JSON files. The chosen DAL is
+created once per process and reused by every caller.
+"""
+
+import atexit
+from functools import lru_cache
+
+from pete_e.config import settings
+from pete_e.infra import log_utils
+from .dal import DataAccessLayer
+from .json_dal import JsonDal
+
+
+@lru_cache(maxsize=1)
+def get_dal() -> DataAccessLayer:
+    """Return the process-wide DAL, choosing Postgres or JSON on first call."""
+    if settings.DATABASE_URL and settings.ENVIRONMENT == "production":
+        try:
+            from . import postgres_dal
+
+            dal = postgres_dal.PostgresDal()
+            # Drain the pool's connections cleanly when a one-shot CLI exits.
+            atexit.register(postgres_dal.pool.close)
+            return dal
+        except Exception as e:
+            log_utils.log_message(
+                f"Postgres DAL init failed: {e}. Falling back to JSON.", "WARN"
+            )
+    return JsonDal()
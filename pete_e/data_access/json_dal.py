@@ -2,29 +2,58 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+from bisect import insort
 from datetime import date, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pete_e.config import settings
-from pete_e.infra import log_utils
+from pete_e.infra import json_utils, log_utils
 from .dal import DataAccessLayer
 
+_by_date = itemgetter("date")
+
 
 class JsonDal(DataAccessLayer):
     """Data Access Layer that persists data to JSON files on disk."""
 
+    def __init__(self) -> None:
+        # Raw bytes per file with the (mtime_ns, size) they were read at; an
+        # entry is reused while the file is unchanged and refreshed by our own
+        # writes, so repeated loads within a run skip the disk read. Bytes
+        # rather than parsed objects are kept so every load decodes a fresh
+        # structure that callers are free to mutate.
+        self._cache: Dict[Path, tuple] = {}
+
     def _read_json(self, path: Path) -> Any:
-        if not path.exists():
+        try:
+            return self._load_json(path)
+        except FileNotFoundError:
             return {}
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
 
-    def _write_json(self, path: Path, data: Any) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+    def _load_json(self, path: Path) -> Any:
+        """Parse ``path`` (from its cached bytes if unchanged); raises FileNotFoundError."""
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        hit = self._cache.get(path)
+        if hit is not None and hit[0] == stamp:
+            raw = hit[1]
+        else:
+            raw = path.read_bytes()
+            self._cache[path] = (stamp, raw)
+        return json_utils.loads(raw)
+
+    def _write_json(self, path: Path, data: Any, fsync: bool = False) -> None:
+        try:
+            raw = json_utils.write_json(path, data, fsync=fsync)
+        except Exception:
+            self._cache.pop(path, None)
+            raise
+        if path in self._cache:
+            st = path.stat()
+            self._cache[path] = ((st.st_mtime_ns, st.st_size), raw)
 
     # --- Lift Log Operations -------------------------------------------------
     def load_lift_log(self) -> Dict[str, Any]:
@@ -42,18 +71,38 @@ class JsonDal(DataAccessLayer):
         rir: Optional[float] = None,
     ) -> None:
         log = self.load_lift_log()
-        key = str(exercise_id)
-        log.setdefault(key, [])
-        log[key].append(
+        # Entries stay in date order (readers take the last N); insort puts a
+        # back-filled day in place and is a plain append for the newest one.
+        insort(
+            log.setdefault(str(exercise_id), []),
             {
                 "date": log_date.isoformat(),
                 "reps": reps,
                 "weight": weight_kg,
                 "rir": rir,
-            }
+            },
+            key=_by_date,
         )
         self.save_lift_log(log)
 
+    def save_strength_log_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Append all sets with a single read and write of the lift log."""
+        if not entries:
+            return
+        log = self.load_lift_log()
+        for e in entries:
+            insort(
+                log.setdefault(str(e["exercise_id"]), []),
+                {
+                    "date": e["log_date"].isoformat(),
+                    "reps": e["reps"],
+                    "weight": e["weight_kg"],
+                    "rir": e.get("rir"),
+                },
+                key=_by_date,
+            )
+        self.save_lift_log(log)
+
     # --- History Operations --------------------------------------------------
     def load_history(self) -> Dict[str, Any]:
         return self._read_json(settings.history_path)
@@ -62,10 +111,15 @@ class JsonDal(DataAccessLayer):
         self._write_json(settings.history_path, history)
 
     def save_daily_summary(self, summary: Dict[str, Any], day: date) -> None:
-        daily_path = settings.daily_knowledge_path / f"{day.isoformat()}.json"
+        key = day.isoformat()
+        daily_path = settings.daily_knowledge_path / f"{key}.json"
         self._write_json(daily_path, summary)
         history = self.load_history()
-        history[day.isoformat()] = summary
+        if history.get(key) == summary:
+            # Re-running a sync for the same day is the common case; leave
+            # history.json untouched rather than rewriting the whole file.
+            return
+        history[key] = summary
         self.save_history(history)
 
     # --- Analytical Helpers --------------------------------------------------
@@ -74,14 +128,19 @@ class JsonDal(DataAccessLayer):
 
     def get_historical_metrics(self, days: int) -> List[Dict[str, Any]]:
         history = self.load_history()
-        sorted_days = sorted(history.keys())[-days:]
-        return [history[d] for d in sorted_days]
+        if days <= 0:
+            # Keep the slice semantics callers relied on: 0 means every day
+            return [history[d] for d in sorted(history)[-days:]]
+        # Only the newest N dates are needed; nlargest avoids sorting every key
+        newest = heapq.nlargest(days, history)
+        return [history[d] for d in reversed(newest)]
 
     def get_daily_summary(self, target_date: date) -> Optional[Dict[str, Any]]:
         daily_path = settings.daily_knowledge_path / f"{target_date.isoformat()}.json"
-        if not daily_path.exists():
+        try:
+            return self._load_json(daily_path)
+        except FileNotFoundError:
             return None
-        return self._read_json(daily_path)
 
     def get_historical_data(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         out: List[Dict[str, Any]] = []
@@ -97,7 +156,8 @@ class JsonDal(DataAccessLayer):
     def save_training_plan(self, plan: dict, start_date: date) -> None:
         """Write the training plan to disk under wger_plans_path."""
         path = settings.wger_plans_path / f"plan_{start_date.isoformat()}.json"
-        self._write_json(path, plan)
+        # A plan is written once per cycle and then pushed; make it durable
+        self._write_json(path, plan, fsync=True)
 
     def save_validation_log(self, tag: str, adjustments: List[str]) -> None:
         """Persist validation logs via the central log util."""
@@ -7,11 +7,16 @@ robust connection pool for efficiency and reliability.
 
 from datetime import date
 from typing import Any, Dict, List, Optional
-import json
 
 from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb, set_json_dumps
 from psycopg_pool import ConnectionPool
 
+try:  # orjson is optional; psycopg's default json.dumps is used without it
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 from pete_e.config import settings
 from pete_e.infra import log_utils
 from .dal import DataAccessLayer
@@ -23,14 +28,50 @@ from .dal import DataAccessLayer
 if not settings.DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in the configuration. Cannot initialize connection pool.")
 
+# Jsonb parameters are serialised by psycopg's registered dumper; orjson
+# emits UTF-8 bytes directly instead of an intermediate Python str.
+if orjson is not None:
+    set_json_dumps(lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+
 pool = ConnectionPool(
     conninfo=settings.DATABASE_URL,
     min_size=1,
     max_size=3,
-    # This tells psycopg to return rows as dictionary-like objects, which is
-    # very convenient for converting to/from our application's data structures.
-    row_factory=dict_row
+    # Connection options go through ``kwargs``. dict_row tells psycopg to return
+    # rows as dictionary-like objects, which is very convenient for converting
+    # to/from our application's data structures.
+    kwargs={"row_factory": dict_row},
+)
+
+
+# daily_summary columns in the order produced by PostgresDal._summary_to_row
+_SUMMARY_COLUMNS = (
+    "summary_date", "weight_kg", "body_fat_pct", "muscle_mass_kg", "water_pct",
+    "steps", "exercise_minutes", "calories_active", "calories_resting", "stand_minutes",
+    "distance_m", "hr_resting", "hr_avg", "hr_max", "hr_min",
+    "sleep_total_minutes", "sleep_asleep_minutes", "sleep_rem_minutes",
+    "sleep_deep_minutes", "sleep_core_minutes", "sleep_awake_minutes",
 )
+_SUMMARY_COLUMN_LIST = ", ".join(_SUMMARY_COLUMNS)
+_SUMMARY_UPDATE_SET = ", ".join(f"{c} = EXCLUDED.{c}" for c in _SUMMARY_COLUMNS[1:])
+
+# Statement text is built once so every call hands psycopg the same string,
+# which is what its per-connection prepared-statement cache keys on.
+_SQL_UPSERT_SUMMARY = f"""
+    INSERT INTO daily_summary ({_SUMMARY_COLUMN_LIST})
+    VALUES ({", ".join(["%s"] * len(_SUMMARY_COLUMNS))})
+    ON CONFLICT (summary_date) DO UPDATE SET {_SUMMARY_UPDATE_SET};
+"""
+_SQL_MERGE_SUMMARY_STAGE = f"""
+    INSERT INTO daily_summary ({_SUMMARY_COLUMN_LIST})
+    SELECT {_SUMMARY_COLUMN_LIST} FROM daily_summary_stage
+    ON CONFLICT (summary_date) DO UPDATE SET {_SUMMARY_UPDATE_SET};
+"""
+_SQL_INSERT_STRENGTH = """
+    INSERT INTO strength_log (
+        summary_date, exercise_id, reps, weight_kg, rir
+    ) VALUES (%s, %s, %s, %s, %s);
+"""
 
 
 class PostgresDal(DataAccessLayer):
@@ -66,72 +107,50 @@ class PostgresDal(DataAccessLayer):
             return {}
         return lift_log
 
+    def load_lift_history(
+        self, exercise_id: int, last_n: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Loads one exercise's sets, newest N only when ``last_n`` is given."""
+        out: List[Dict[str, Any]] = []
+        try:
+            with pool.connection() as conn:
+                with conn.cursor() as cur:
+                    # Newest first so LIMIT keeps the latest sets (NULL = no limit);
+                    # served by idx_strength_log_exercise_id.
+                    cur.execute(
+                        """
+                        SELECT summary_date, reps, weight_kg, rir FROM strength_log
+                        WHERE exercise_id = %s
+                        ORDER BY summary_date DESC, id DESC
+                        LIMIT %s;
+                        """,
+                        (exercise_id, last_n or None),
+                    )
+                    for row in reversed(cur.fetchall()):
+                        out.append({
+                            "date": row["summary_date"].isoformat(),
+                            "reps": row["reps"],
+                            "weight": float(row["weight_kg"]),
+                            "rir": float(row["rir"]) if row["rir"] is not None else None,
+                        })
+        except Exception as e:
+            log_utils.log_message(
+                f"Error loading lift history for exercise {exercise_id}: {e}", "ERROR"
+            )
+        return out
+
     def save_daily_summary(self, summary: Dict[str, Any], day: date) -> None:
-        """Upserts a row into ``daily_summary``."""
+        """Upserts a row into ``daily_summary`` (prepared once per pooled connection)."""
         log_utils.log_message(
             f"[PostgresDal] Saving daily summary for {day.isoformat()}", "INFO"
         )
-        withings = summary.get("withings", {})
-        apple = summary.get("apple", {})
-        sleep = apple.get("sleep", {})
-
         try:
             with pool.connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        """
-                        INSERT INTO daily_summary (
-                            summary_date, weight_kg, body_fat_pct, muscle_mass_kg, water_pct,
-                            steps, exercise_minutes, calories_active, calories_resting, stand_minutes,
-                            distance_m, hr_resting, hr_avg, hr_max, hr_min,
-                            sleep_total_minutes, sleep_asleep_minutes, sleep_rem_minutes,
-                            sleep_deep_minutes, sleep_core_minutes, sleep_awake_minutes
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (summary_date) DO UPDATE SET
-                            weight_kg = EXCLUDED.weight_kg,
-                            body_fat_pct = EXCLUDED.body_fat_pct,
-                            muscle_mass_kg = EXCLUDED.muscle_mass_kg,
-                            water_pct = EXCLUDED.water_pct,
-                            steps = EXCLUDED.steps,
-                            exercise_minutes = EXCLUDED.exercise_minutes,
-                            calories_active = EXCLUDED.calories_active,
-                            calories_resting = EXCLUDED.calories_resting,
-                            stand_minutes = EXCLUDED.stand_minutes,
-                            distance_m = EXCLUDED.distance_m,
-                            hr_resting = EXCLUDED.hr_resting,
-                            hr_avg = EXCLUDED.hr_avg,
-                            hr_max = EXCLUDED.hr_max,
-                            hr_min = EXCLUDED.hr_min,
-                            sleep_total_minutes = EXCLUDED.sleep_total_minutes,
-                            sleep_asleep_minutes = EXCLUDED.sleep_asleep_minutes,
-                            sleep_rem_minutes = EXCLUDED.sleep_rem_minutes,
-                            sleep_deep_minutes = EXCLUDED.sleep_deep_minutes,
-                            sleep_core_minutes = EXCLUDED.sleep_core_minutes,
-                            sleep_awake_minutes = EXCLUDED.sleep_awake_minutes;
-                        """,
-                        (
-                            day,
-                            withings.get("weight"),
-                            withings.get("fat_percent"),
-                            withings.get("muscle_mass"),
-                            withings.get("water_percent"),
-                            apple.get("steps"),
-                            apple.get("exercise_minutes"),
-                            apple.get("calories", {}).get("active"),
-                            apple.get("calories", {}).get("resting"),
-                            apple.get("stand_minutes"),
-                            apple.get("distance_m"),
-                            apple.get("heart_rate", {}).get("resting"),
-                            apple.get("heart_rate", {}).get("avg"),
-                            apple.get("heart_rate", {}).get("max"),
-                            apple.get("heart_rate", {}).get("min"),
-                            sleep.get("in_bed"),
-                            sleep.get("asleep"),
-                            sleep.get("rem"),
-                            sleep.get("deep"),
-                            sleep.get("core"),
-                            sleep.get("awake"),
-                        ),
+                        _SQL_UPSERT_SUMMARY,
+                        self._summary_to_row(summary, day),
+                        prepare=True,
                     )
         except Exception as e:
             log_utils.log_message(
@@ -161,18 +180,49 @@ class PostgresDal(DataAccessLayer):
             with pool.connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        """
-                        INSERT INTO strength_log (
-                            summary_date, exercise_id, reps, weight_kg, rir
-                        ) VALUES (%s, %s, %s, %s, %s);
-                        """,
+                        _SQL_INSERT_STRENGTH,
                         (log_date, exercise_id, reps, weight_kg, rir),
+                        prepare=True,
                     )
         except Exception as e:
             log_utils.log_message(
                 f"Error saving strength log entry for {log_date}: {e}", "ERROR"
             )
 
+    def save_strength_log_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Insert many sets into ``strength_log`` in one transaction.
+
+        The batch is all-or-nothing, so if it fails each set is retried on its
+        own through ``save_strength_log_entry``; a bad row only loses its set.
+        """
+        if not entries:
+            return
+        try:
+            with pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        _SQL_INSERT_STRENGTH,
+                        [
+                            (e["log_date"], e["exercise_id"], e["reps"], e["weight_kg"], e.get("rir"))
+                            for e in entries
+                        ],
+                    )
+        except Exception as e:
+            log_utils.log_message(
+                f"Batch save of {len(entries)} strength log entries failed ({e}); "
+                "retrying entry by entry",
+                "WARN",
+            )
+            for entry in entries:
+                self.save_strength_log_entry(
+                    entry["exercise_id"],
+                    entry["log_date"],
+                    entry["reps"],
+                    entry["weight_kg"],
+                    entry.get("rir"),
+                )
+
     def load_history(self) -> Dict[str, Any]:
         """Return all rows from ``daily_summary`` keyed by ISO date."""
         out: Dict[str, Any] = {}
@@ -231,14 +281,78 @@ class PostgresDal(DataAccessLayer):
         return out
 
     def save_history(self, history: Dict[str, Any]) -> None:
-        """Persist provided history by upserting each summary."""
+        """
+        Persist provided history in bulk: COPY every summary into a temporary
+        staging table, then upsert them into ``daily_summary`` in one statement.
+
+        The COPY is all-or-nothing, so if it fails each day is retried on its
+        own through ``save_daily_summary``; one bad value only loses its day.
+        """
+        days = []
         for day_str, data in history.items():
             try:
-                self.save_daily_summary(data, date.fromisoformat(day_str))
+                day = date.fromisoformat(day_str)
+                days.append((day, data, self._summary_to_row(data, day)))
             except Exception as e:
                 log_utils.log_message(
                     f"Error saving history for {day_str}: {e}", "ERROR"
                 )
+        if not days:
+            return
+
+        try:
+            with pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "CREATE TEMP TABLE daily_summary_stage "
+                        "(LIKE daily_summary INCLUDING DEFAULTS) ON COMMIT DROP;"
+                    )
+                    with cur.copy(
+                        f"COPY daily_summary_stage ({_SUMMARY_COLUMN_LIST}) FROM STDIN"
+                    ) as copy:
+                        for _, _, row in days:
+                            copy.write_row(row)
+                    cur.execute(_SQL_MERGE_SUMMARY_STAGE)
+        except Exception as e:
+            log_utils.log_message(
+                f"Bulk history save of {len(days)} rows failed ({e}); "
+                "retrying day by day",
+                "WARN",
+            )
+            for day, data, _ in days:
+                self.save_daily_summary(data, day)
+
+    @staticmethod
+    def _summary_to_row(summary: Dict[str, Any], day: date) -> tuple:
+        """Flatten a consolidated summary into a ``daily_summary`` row tuple."""
+        withings = summary.get("withings", {})
+        apple = summary.get("apple", {})
+        calories = apple.get("calories", {})
+        heart = apple.get("heart_rate", {})
+        sleep = apple.get("sleep", {})
+        return (
+            day,
+            withings.get("weight"),
+            withings.get("fat_percent"),
+            withings.get("muscle_mass"),
+            withings.get("water_percent"),
+            apple.get("steps"),
+            apple.get("exercise_minutes"),
+            calories.get("active"),
+            calories.get("resting"),
+            apple.get("stand_minutes"),
+            apple.get("distance_m"),
+            heart.get("resting"),
+            heart.get("avg"),
+            heart.get("max"),
+            heart.get("min"),
+            sleep.get("in_bed"),
+            sleep.get("asleep"),
+            sleep.get("rem"),
+            sleep.get("deep"),
+            sleep.get("core"),
+            sleep.get("awake"),
+        )
 
     def _row_to_summary(self, row: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -362,7 +476,7 @@ class PostgresDal(DataAccessLayer):
                         VALUES (%s, %s)
                         ON CONFLICT (start_date) DO UPDATE SET plan = EXCLUDED.plan;
                         """,
-                        (start_date, json.dumps(plan)),
+                        (start_date, Jsonb(plan)),
                     )
         except Exception as e:
             log_utils.log_message(
@@ -1,14 +1,22 @@
 import subprocess
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Commit identity passed per invocation instead of rewriting the repo config
+BOT_IDENTITY = (
+    "-c", "user.name=github-actions[bot]",
+    "-c", "user.email=github-actions[bot]@users.noreply.github.com",
+)
 
 def commit_changes(report_type: str, phrase: str):
     """Stage all changes and commit to git."""
-    subprocess.run(["git", "config", "user.name", "github-actions[bot]"], check=True)
-    subprocess.run(["git", "config", "user.email", "github-actions[bot]@users.noreply.github.com"], check=True)
     subprocess.run(["git", "add", "-A"], check=False)
-    msg = f"pete log update ({report_type}) | {phrase} ({datetime.utcnow().strftime('%Y-%m-%d')})"
+    # Exit status 0 means nothing is staged, so there is nothing to commit or push
+    if subprocess.run(["git", "diff", "--cached", "--quiet"], check=False).returncode == 0:
+        print("No changes to commit.")
+        return
+    msg = f"pete log update ({report_type}) | {phrase} ({datetime.now(timezone.utc).strftime('%Y-%m-%d')})"
     try:
-        subprocess.run(["git", "commit", "-m", msg], check=True)
+        subprocess.run(["git", *BOT_IDENTITY, "commit", "-m", msg], check=True)
         subprocess.run(["git", "push"], check=True)
-    except subprocess.CalledProcessError:
-        print("No changes to commit.")
+    except subprocess.CalledProcessError as e:
+        print(f"git commit/push failed: {e}")
@@ -0,0 +1,39 @@
+"""Shared HTTP session setup for the API clients."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "fitness-oauth-bridge"
+
+
+def session_with_retries(
+    headers: Optional[Dict[str, str]] = None,
+    methods: Iterable[str] = ("GET",),
+    pool_maxsize: int = 8,
+) -> requests.Session:
+    """
+    Keep-alive session with backoff retries on throttling and 5xx responses.
+
+    Status retries apply only to ``methods``. The default is GET, because a
+    5xx to a POST may arrive after the server acted on it, and re-sending it
+    could repeat the action (e.g. a token refresh). Connection failures, where
+    nothing was sent, are retried for every method.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.6,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(methods),
+        raise_on_status=False,
+    )
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry))
+    s.headers.update({"User-Agent": USER_AGENT})
+    if headers:
+        s.headers.update(headers)
+    return s
@@ -0,0 +1,80 @@
+"""Fast, atomic JSON persistence shared by the file-backed stores."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+try:  # orjson is optional; fall back to the stdlib encoder when missing
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(raw: bytes) -> Any:
+    """Parse JSON from raw bytes (orjson decodes UTF-8 itself, no str copy)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file in one go."""
+    return loads(path.read_bytes())
+
+
+def dumps(data: Any) -> bytes:
+    """Serialise ``data`` as indented, key-sorted UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+# Directories already created this process; skips a mkdir syscall per write
+_dirs_ready: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    if directory not in _dirs_ready:
+        directory.mkdir(parents=True, exist_ok=True)
+        _dirs_ready.add(directory)
+
+
+def write_json(
+    path: Path, data: Any, fsync: bool = False, mode: Optional[int] = None
+) -> bytes:
+    """
+    Write ``data`` to ``path`` via a temp file so readers never see a partial file.
+
+    With ``fsync`` the bytes are forced to disk before the rename, for files
+    that must survive a crash straight after the write. With ``mode`` the
+    temp file is created with those permissions, so secrets are never
+    readable under the default umask, not even briefly. Returns the bytes
+    written.
+    """
+    raw = dumps(data)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    opener = None if mode is None else (lambda p, flags: os.open(p, flags, mode))
+    _ensure_dir(path.parent)
+    try:
+        f = open(tmp, "wb", opener=opener)
+    except FileNotFoundError:
+        # The directory was removed since we last created it; make it again
+        _dirs_ready.discard(path.parent)
+        _ensure_dir(path.parent)
+        f = open(tmp, "wb", opener=opener)
+    with f:
+        if mode is not None:
+            # A leftover temp file keeps its old permissions when reopened
+            os.chmod(tmp, mode)
+        f.write(raw)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return raw
@@ -1,12 +1,81 @@
-from datetime import datetime
+import atexit
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
 from pete_e.config import settings
 
+# Dedicated logger for the Pete history file; kept off the root logger so
+# library chatter never lands in the history log.
+_logger = logging.getLogger("pete_e.history")
+_logger.setLevel(logging.DEBUG)
+_logger.propagate = False
+
+# Callers only enqueue; a background listener thread does the file writes.
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_logger.addHandler(QueueHandler(_queue))
+_listener = None
+_log_file = None
+# Serialises listener start/stop: log_message is called from sync's worker
+# threads, and two racing first calls must not start two listeners.
+_listener_lock = threading.RLock()
+
+
+class _UtcFormatter(logging.Formatter):
+    """Render ``[ISO-UTC timestamp] [LEVEL] message`` like the old per-call writer."""
+
+    def formatTime(self, record, datefmt=None):
+        return datetime.fromtimestamp(record.created, timezone.utc).isoformat()
+
+
+def _stop_listener() -> None:
+    """Drain the queue into the current file and close it."""
+    global _listener, _log_file
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = _log_file = None
+
+
+def _ensure_listener(log_file) -> None:
+    """Start the writer thread for ``log_file``, swapping it if the path moved."""
+    global _listener, _log_file
+    if _listener is not None and _log_file == log_file:
+        return
+    with _listener_lock:
+        if _listener is not None and _log_file == log_file:
+            return
+        # Records already queued belong to the old file; write them out first
+        _stop_listener()
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(log_file, encoding="utf-8")
+        handler.setFormatter(_UtcFormatter("[%(asctime)s] [%(tag)s] %(message)s"))
+        _listener = QueueListener(_queue, handler)
+        _listener.start()
+        _log_file = log_file
+
+
+def flush() -> None:
+    """Block until every message logged so far is written to the history file."""
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+
+
+# Registered after logging's own hook, so it runs first and nothing queued is lost
+atexit.register(_stop_listener)
+
 
 def log_message(msg: str, level: str = "INFO") -> None:
     """Append a timestamped message to the Pete history log."""
-    log_file = settings.log_path
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(f"[{datetime.utcnow().isoformat()}] [{level}] {msg}\n")
+    _ensure_listener(settings.log_path)
+    levelno = logging.getLevelName(level.upper())
+    if not isinstance(levelno, int):
+        levelno = logging.INFO
+    _logger.log(levelno, msg, extra={"tag": level})
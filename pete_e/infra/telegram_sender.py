@@ -1,8 +1,23 @@
 # pete_e/infra/telegram_sender.py
 
-import requests
+from functools import lru_cache
+
 from pete_e.infra import log_utils
 
+
+@lru_cache(maxsize=1)
+def _session():
+    """Keep-alive session reused across sends, built on first use.
+
+    Importing requests costs ~70 ms, so CLI runs that never send a message
+    skip it. Only connection failures are retried: re-sending a sendMessage
+    that reached Telegram could post twice.
+    """
+    from pete_e.infra.http_utils import session_with_retries
+
+    return session_with_retries(methods=())
+
+
 def send_telegram_message(token: str, chat_id: str, message: str) -> None:
     """
     Send a plain‑text message via the Telegram Bot API.
@@ -15,7 +30,7 @@ def send_telegram_message(token: str, chat_id: str, message: str) -> None:
     url = f"https://api.telegram.org/bot{token}/sendMessage"
     payload = {"chat_id": chat_id, "text": message}
     try:
-        response = requests.post(url, json=payload, timeout=20)
+        response = _session().post(url, json=payload, timeout=20)
         response.raise_for_status()
         log_utils.log_message("Telegram message sent.", "INFO")
     except Exception as e:
@@ -0,0 +1,35 @@
+import math
+
+import pytest
+
+from pete_e.core.apple_client import clean_num
+
+
+@pytest.mark.parametrize(
+    "value, as_int, expected",
+    [
+        (None, True, None),
+        (42, True, 42),
+        (7.9, True, 7),
+        ("1,234", True, 1234),
+        (" 7.5 ", False, 7.5),
+        ("-3", True, -3),
+        (".5", False, 0.5),
+        ("", True, None),
+        ("n/a", True, None),
+        ("1.2.3", False, None),
+        ("1e3", True, 1000),
+        ("2.5E-1", False, 0.25),
+        ("1_000", True, 1000),
+        ("inf", False, math.inf),
+        ("-inf", False, -math.inf),
+        ("inf", True, None),
+        ("nan", True, None),
+    ],
+)
+def test_clean_num(value, as_int, expected):
+    assert clean_num(value, as_int=as_int) == expected
+
+
+def test_clean_num_nan_float():
+    assert math.isnan(clean_num("nan", as_int=False))
@@ -34,3 +34,87 @@ def test_json_dal_roundtrip(tmp_path, monkeypatch):
     dal.save_training_plan(plan, day)
     plan_path = settings.wger_plans_path / f"plan_{day.isoformat()}.json"
     assert plan_path.exists()
+
+
+def test_json_dal_batch_strength_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+
+    day = date(2024, 1, 2)
+    dal.save_strength_log_entries(
+        [
+            {"exercise_id": 1, "log_date": day, "reps": 5, "weight_kg": 100.0, "rir": 2},
+            {"exercise_id": 1, "log_date": day, "reps": 5, "weight_kg": 100.0},
+            {"exercise_id": 2, "log_date": day, "reps": 8, "weight_kg": 40.0, "rir": None},
+        ]
+    )
+    log = dal.load_lift_log()
+    assert [e["rir"] for e in log["1"]] == [2, None]
+    assert log["2"] == [{"date": "2024-01-02", "reps": 8, "weight": 40.0, "rir": None}]
+
+
+def test_json_dal_lift_log_stays_date_ordered(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+
+    dal.save_strength_log_entry(1, date(2024, 1, 3), 5, 102.5)
+    dal.save_strength_log_entry(1, date(2024, 1, 1), 5, 100.0)
+    dal.save_strength_log_entry(1, date(2024, 1, 2), 5, 101.0)
+
+    assert [e["date"] for e in dal.load_lift_log()["1"]] == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+    ]
+
+
+def test_json_dal_lift_log_cache_tracks_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+
+    dal.save_strength_log_entry(1, date(2024, 1, 1), 5, 100.0)
+    assert dal.load_lift_log()["1"][0]["weight"] == 100.0
+
+    # Another writer (e.g. a second process) replaces the file
+    JsonDal().save_lift_log({"2": []})
+    assert dal.load_lift_log() == {"2": []}
+
+
+def test_json_dal_resaving_edited_summary_updates_history(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+    day = date(2024, 1, 1)
+
+    dal.save_daily_summary({"apple": {"steps": 0}}, date(2023, 12, 31))
+    dal.load_history()  # warm the cache before the summary is stored
+
+    summary = {"apple": {"steps": 1}}
+    dal.save_daily_summary(summary, day)
+    summary["apple"]["steps"] = 2
+    dal.save_daily_summary(summary, day)
+
+    on_disk = JsonDal().load_history()
+    assert on_disk[day.isoformat()] == {"apple": {"steps": 2}}
+    assert dal.load_history() == on_disk
+
+
+def test_json_dal_loads_return_independent_copies(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+
+    dal.save_daily_summary({"apple": {"steps": 1}}, date(2024, 1, 1))
+    dal.load_history().pop("2024-01-01")
+    assert "2024-01-01" in dal.load_history()
+
+    dal.save_daily_summary({"apple": {"steps": 2}}, date(2024, 1, 2))
+    assert sorted(dal.load_history()) == ["2024-01-01", "2024-01-02"]
+
+
+def test_json_dal_historical_metrics_zero_days_returns_everything(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    dal = JsonDal()
+    for day in (3, 1, 2):
+        dal.save_daily_summary({"apple": {"steps": day}}, date(2024, 1, day))
+
+    assert [m["apple"]["steps"] for m in dal.get_historical_metrics(2)] == [2, 3]
+    assert [m["apple"]["steps"] for m in dal.get_historical_metrics(0)] == [1, 2, 3]
@@ -0,0 +1,42 @@
+import threading
+
+from pete_e.config import settings
+from pete_e.infra import log_utils
+
+
+def test_log_message_writes_tagged_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+
+    log_utils.log_message("hello", "WARN")
+    log_utils.log_message("100% done")
+    log_utils.flush()
+
+    lines = settings.log_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("] [WARN] hello")
+    assert lines[1].endswith("] [INFO] 100% done")
+
+
+def test_concurrent_first_calls_start_one_listener(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    log_utils._stop_listener()
+
+    started = []
+    real_start = log_utils.QueueListener.start
+
+    def counting_start(self):
+        started.append(self)
+        real_start(self)
+
+    monkeypatch.setattr(log_utils.QueueListener, "start", counting_start)
+    threads = [
+        threading.Thread(target=log_utils.log_message, args=(f"msg {i}",))
+        for i in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(started) == 1
+    log_utils._stop_listener()  # drains into the file and closes it
+    assert len(settings.log_path.read_text(encoding="utf-8").splitlines()) == 8
@@ -0,0 +1,25 @@
+from pete_e.core.orchestrator import Orchestrator
+
+
+def _history(*rhrs):
+    return {
+        f"2024-01-0{i}": {"apple": {"heart_rate": {"resting": rhr}}}
+        for i, rhr in enumerate(rhrs, start=1)
+    }
+
+
+def test_metric_values_read_the_newest_days_in_order():
+    orch = Orchestrator(dal=None)
+    history = _history(50, None, 54, 56)
+
+    assert orch._get_metric_values(history, "rhr", 3) == [54, 56]
+    assert orch._average(history, "rhr", 2) == 55
+
+
+def test_metric_values_zero_days_covers_the_whole_history():
+    orch = Orchestrator(dal=None)
+    history = _history(50, None, 54, 56)
+
+    assert orch._get_metric_values(history, "rhr", 0) == [50, 54, 56]
+    # Negative windows keep the old slice meaning: drop the oldest N days
+    assert orch._get_metric_values(history, "rhr", -1) == [54, 56]
@@ -0,0 +1,25 @@
+from pete_e.config import settings
+from pete_e.core import phrase_picker
+from pete_e.infra.json_utils import write_json
+
+
+def _write_bank(root, text):
+    write_json(
+        root / "resources" / "phrases_tagged.json",
+        [{"text": text, "kind": "motivational", "mode": "motivational", "tags": ["#Go"]}],
+    )
+
+
+def test_reloaded_phrase_bank_is_not_served_from_stale_pools(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(phrase_picker, "_all_phrases", None)
+
+    _write_bank(tmp_path, "old bank")
+    assert phrase_picker.random_phrase(mode="serious") == "old bank"
+    assert phrase_picker.random_phrase(tags=["#Go"], mode="serious") == "old bank"
+
+    # Resetting the bank must also drop the pools built from it
+    _write_bank(tmp_path, "new bank")
+    phrase_picker._all_phrases = None
+    assert phrase_picker.random_phrase(mode="serious") == "new bank"
+    assert phrase_picker.random_phrase(tags=["#Go"], mode="serious") == "new bank"
@@ -0,0 +1,34 @@
+import datetime
+
+from pete_e.core.plan_builder import build_block
+
+from test_progression import DummyDal, make_metrics
+
+
+def _heavy_days(plan):
+    return {
+        day["day"]
+        for week in plan["weeks"]
+        for day in week["days"]
+        for s in day["sessions"]
+        if s.get("intensity") == "heavy"
+    }
+
+
+def test_block_without_recovery_metrics_falls_back_to_late_heavy_days():
+    # Seven days synced but none carry RHR or sleep: averaging must not fail
+    metrics = [{"apple": {"steps": 5000}} for _ in range(7)]
+    dal = DummyDal({"1": [{"weight": 100}]}, metrics, [])
+
+    plan = build_block(dal, datetime.date(2024, 1, 1))
+
+    assert len(plan["weeks"]) == 4
+    assert _heavy_days(plan) == {"Tue", "Fri"}
+
+
+def test_block_with_good_recovery_front_loads_heavy_days():
+    dal = DummyDal({"1": [{"weight": 100}]}, make_metrics(50, 480, 7), [])
+
+    plan = build_block(dal, datetime.date(2024, 1, 1))
+
+    assert _heavy_days(plan) == {"Mon", "Thu"}
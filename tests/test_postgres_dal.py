@@ -65,3 +65,60 @@ def test_postgres_dal_roundtrip(tmp_path, monkeypatch):
             row = cur.fetchone()
             assert row and row[0]["start"] == day.isoformat()
 
+
+
+@pytest.mark.skipif(PostgresDal is None, reason="TEST_DATABASE_URL not configured")
+def test_postgres_dal_save_history_isolates_bad_days(tmp_path, monkeypatch):
+    """A value the COPY rejects only loses its own day, not the whole batch."""
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+
+    schema = Path("init-db/schema.sql").read_text()
+    with psycopg.connect(TEST_DB_URL, autocommit=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute(schema)
+
+    dal = PostgresDal()
+    dal.save_history(
+        {
+            "2024-02-01": {"withings": {"weight": 81}, "apple": {"steps": 1200}},
+            "2024-02-02": {"apple": {"steps": "not-a-number"}},
+            "2024-02-03": {"withings": {"weight": 82}, "apple": {"steps": 900}},
+            "not-a-date": {"withings": {"weight": 99}},
+        }
+    )
+
+    assert dal.get_daily_summary(date(2024, 2, 1))["withings"]["weight"] == 81
+    assert dal.get_daily_summary(date(2024, 2, 3))["apple"]["steps"] == 900
+    assert dal.get_daily_summary(date(2024, 2, 2)) is None
+
+
+@pytest.mark.skipif(PostgresDal is None, reason="TEST_DATABASE_URL not configured")
+def test_postgres_dal_save_strength_log_entries_isolates_bad_sets(tmp_path, monkeypatch):
+    """A set the batch insert rejects only loses itself, not the whole sync."""
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+
+    schema = Path("init-db/schema.sql").read_text()
+    with psycopg.connect(TEST_DB_URL, autocommit=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute(schema)
+            cur.execute(
+                "INSERT INTO wger_exercise (id, uuid, name) VALUES "
+                "(1, '00000000-0000-0000-0000-000000000001', 'Squat');"
+            )
+
+    dal = PostgresDal()
+    day = date(2024, 3, 2)
+    dal.save_daily_summary({"withings": {}, "apple": {}}, day)
+    dal.save_strength_log_entries(
+        [
+            {"exercise_id": 1, "log_date": day, "reps": 5, "weight_kg": 100},
+            # No daily_summary for the day before: breaks the foreign key
+            {"exercise_id": 1, "log_date": date(2024, 3, 1), "reps": 5, "weight_kg": 90},
+            # Unknown exercise
+            {"exercise_id": 999, "log_date": day, "reps": 5, "weight_kg": 50},
+            {"exercise_id": 1, "log_date": day, "reps": 3, "weight_kg": 110, "rir": 1},
+        ]
+    )
+
+    history = dal.load_lift_history(1)
+    assert [(h["reps"], h["weight"]) for h in history] == [(5, 100.0), (3, 110.0)]
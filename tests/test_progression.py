@@ -180,3 +180,17 @@ def test_no_rir_uses_weight_and_recovery():
     weight = adjusted["days"][0]["sessions"][0]["exercises"][0]["weight_target"]
     assert weight == 105.0
     assert any("no RIR" in n for n in notes)
+
+
+def test_week_without_weights_skips_dal():
+    class NoFetchDal(DummyDal):
+        def load_lift_log(self):
+            raise AssertionError("lift log should not be loaded")
+
+        def get_historical_metrics(self, days):
+            raise AssertionError("metrics should not be fetched")
+
+    week = {"days": [{"sessions": [{"type": "hiit"}, {"type": "rest"}]}]}
+    adjusted, notes = apply_progression(NoFetchDal({}, [], []), week, None)
+    assert adjusted is week
+    assert notes == []
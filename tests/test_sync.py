@@ -0,0 +1,77 @@
+from pete_e.core import sync
+
+
+def _record_syncs(monkeypatch):
+    calls = []
+
+    def fake_run_sync(dal):
+        calls.append(dal)
+        return True, []
+
+    monkeypatch.setattr(sync, "run_sync", fake_run_sync)
+    monkeypatch.setattr(sync, "_last_success", None)
+    return calls
+
+
+def test_recent_sync_is_reused_only_for_the_same_dal(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync.settings, "PROJECT_ROOT", tmp_path)
+    calls = _record_syncs(monkeypatch)
+
+    first, other = object(), object()
+    assert sync.run_sync_with_retries(dal=first)
+    assert sync.run_sync_with_retries(dal=first)
+    assert calls == [first]
+
+    # A different DAL inside the TTL window must still be written to
+    assert sync.run_sync_with_retries(dal=other)
+    assert calls == [first, other]
+
+
+def test_stale_sync_runs_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync.settings, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(sync.settings, "SYNC_TTL_SECONDS", 0)
+    calls = _record_syncs(monkeypatch)
+
+    dal = object()
+    sync.run_sync_with_retries(dal=dal)
+    sync.run_sync_with_retries(dal=dal)
+    assert calls == [dal, dal]
+
+
+def test_run_sync_computes_body_age_from_the_fetched_day(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync.settings, "PROJECT_ROOT", tmp_path)
+    today = sync.date.today().isoformat()
+
+    class FakeWithings:
+        def get_summary(self, days_back):
+            return {"date": today, "weight": 80, "fat_percent": 18}
+
+    class FakeWger:
+        def get_logs_by_date(self, days):
+            return {}
+
+    class FakeDal:
+        def save_daily_summary(self, summary, day):
+            pass
+
+        def save_strength_log_entries(self, entries):
+            pass
+
+    apple = {"date": today, "steps": 9000, "heart_rate": {"resting": 55}}
+    monkeypatch.setattr(sync, "WithingsClient", FakeWithings)
+    monkeypatch.setattr(sync, "WgerClient", FakeWger)
+    monkeypatch.setattr(sync.apple_client, "get_apple_summary", lambda payload: apple)
+
+    results = []
+    real = sync.body_age.calculate_body_age
+
+    def spy(*args, **kwargs):
+        results.append(real(*args, **kwargs))
+        return results[-1]
+
+    monkeypatch.setattr(sync.body_age, "calculate_body_age", spy)
+
+    assert sync.run_sync(FakeDal()) == (True, [])
+    assert len(results) == 1
+    assert results[0]["date"] == today
+    assert "error" not in results[0]
@@ -0,0 +1,32 @@
+import stat
+
+from pete_e.config import settings
+from pete_e.core import withings_client
+from pete_e.core.withings_client import WithingsClient
+
+
+def test_cached_token_is_private_and_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(settings, "WITHINGS_TOKEN_CACHE", True)
+    client = WithingsClient()
+
+    client._store_cached_token("abc", expires_in=3600)
+    path = settings.withings_token_cache_path
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert not path.with_suffix(path.suffix + ".tmp").exists()
+
+    def no_refresh(*args, **kwargs):
+        raise AssertionError("a valid cached token must not trigger a refresh")
+
+    monkeypatch.setattr(withings_client.SESSION, "post", no_refresh)
+    client._refresh_access_token()
+    assert client.access_token == "abc"
+
+
+def test_expired_cached_token_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "PROJECT_ROOT", tmp_path)
+    client = WithingsClient()
+
+    # The stored expiry keeps a 60s safety margin, so this is already stale
+    client._store_cached_token("old", expires_in=30)
+    assert client._load_cached_token() is None